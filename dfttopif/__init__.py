@@ -1,4 +1,6 @@
+from .version import __version__
 from dfttopif.parsers import VaspParser
 from dfttopif.parsers import PwscfParser
 
 from .drivers import *
+from .crawler import find_calculations, crawl_to_pifs
@@ -0,0 +1,309 @@
+'''Content-addressed caches of the pifs of converted calculations, and of their quality reports
+
+Pifs are keyed by a hash of the contents of the files read by the parser, the name and
+version of the parser, the version of dfttopif and the conversion options. The same calculation is
+therefore only parsed once, whether it arrives as a directory or inside an archive.
+Quality reports are keyed by a hash of the OUTCAR and INCAR files, and expire after
+some time, so that the service is not asked again for the score of the same calculation.
+Each cache is stored in a directory, and the least recently used entries are evicted
+when its size goes over a bound.
+
+directory_to_pif (and so tarfile_to_pif and convert) use the cache given as argument, or
+the one configured with the DFTTOPIF_CACHE (path to the cache directory) and
+DFTTOPIF_CACHE_SIZE (maximum size in bytes) environment variables. Quality reports are
+cached in the cache of their client, or the one configured with DFTTOPIF_REPORT_CACHE,
+DFTTOPIF_REPORT_CACHE_SIZE and DFTTOPIF_REPORT_CACHE_TTL (time to live in seconds).
+'''
+
+import os
+import sys
+import json
+import time
+import uuid
+import hashlib
+import threading
+from pypif import pif
+from dfttopif.version import __version__
+from dfttopif.parsers.registry import DirectoryListing
+
+
+class DiskCache(object):
+    '''On-disk cache of JSON entries, with a bound on its total size and an optional time to live'''
+
+    def __init__(self, directory, max_size=1 << 30, ttl=None):
+        '''Open a cache, creating its directory if needed
+
+        Input:
+            directory - String, path to the directory of the cache
+            max_size - int, maximum total size of the entries in bytes
+            ttl - float, time in seconds after which entries expire, or None if they never do
+        '''
+        self.directory = directory
+        self.max_size = max_size
+        self.ttl = ttl
+        self._size = None # estimate of the total size, computed on first use
+        self._lock = threading.Lock()
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def __getstate__(self):
+        # The lock cannot be pickled, e.g. to send the cache to the workers of directories_to_pifs
+        state = self.__dict__.copy()
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.directory, key[:2], key + '.json')
+
+    def get_entry(self, key):
+        '''Get an entry of the cache
+
+        Input:
+            key - String, key of the entry
+        Returns:
+            dict, or None if the entry is not in the cache or has expired
+        '''
+        path = self._path(key)
+        try:
+            with open(path) as fp:
+                entry = json.load(fp)
+            if self.ttl is not None and time.time() - entry.get('created', 0) > self.ttl:
+                os.remove(path)
+                return None
+            os.utime(path, None) # mark as recently used
+        except (IOError, OSError, ValueError):
+            return None
+        return entry
+
+    def put_entry(self, key, entry):
+        '''Store an entry, evicting the least recently used entries if needed
+
+        Input:
+            key - String, key of the entry
+            entry - dict, JSON-serializable contents of the entry
+        '''
+        data = json.dumps(dict(entry, created=time.time()))
+        path = self._path(key)
+        if not os.path.isdir(os.path.dirname(path)):
+            try:
+                os.makedirs(os.path.dirname(path))
+            except OSError:
+                pass # created by another process
+        # Write to a temporary file first, so that readers never see a partial entry
+        temp_path = '%s.%s.tmp' % (path, uuid.uuid4().hex)
+        with open(temp_path, 'w') as fp:
+            fp.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if self._size is None:
+                self._size = sum([size for size, mtime, path in self._entries()])
+            else:
+                self._size += len(data)
+            if self._size > self.max_size:
+                self._evict()
+
+    def _entries(self):
+        '''List the (size, last use, path) of the entries of the cache'''
+        entries = []
+        for subdir in os.listdir(self.directory):
+            subdir = os.path.join(self.directory, subdir)
+            if not os.path.isdir(subdir):
+                continue
+            for f in os.listdir(subdir):
+                if not f.endswith('.json'):
+                    continue
+                try:
+                    st = os.stat(os.path.join(subdir, f))
+                except OSError:
+                    continue # evicted by another process
+                entries.append((st.st_size, st.st_mtime, os.path.join(subdir, f)))
+        return entries
+
+    def _evict(self):
+        '''Remove the least recently used entries, until the cache fills at most 90% of its maximum size'''
+        entries = sorted(self._entries(), key=lambda e: e[1])
+        size = sum([e[0] for e in entries])
+        target = self.max_size * 0.9
+        for entry_size, mtime, path in entries:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            size -= entry_size
+        self._size = size
+
+    def clear(self):
+        '''Remove all the entries of the cache'''
+        with self._lock:
+            for entry_size, mtime, path in self._entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._size = 0
+
+
+def get_parser_version(parser_class):
+    '''Get the version of a parser, so that pifs are converted again when the parser changes
+
+    Input:
+        parser_class - DFTParser subclass
+    Returns:
+        String, the parser_version of the class, or else the __version__ of the package
+            that defines it (e.g., a package providing parsers through entry points), if any
+    '''
+    if parser_class.parser_version is not None:
+        return str(parser_class.parser_version)
+    package = sys.modules.get(parser_class.__module__.split('.')[0])
+    version = getattr(package, '__version__', None)
+    return None if version is None else str(version)
+
+
+class PifCache(DiskCache):
+    '''On-disk cache of pifs, with a bound on its total size'''
+
+    @staticmethod
+    def make_key(directory, parser_class, **options):
+        '''Compute the key of a calculation from the contents of its files
+
+        Input:
+            directory - String, path to the directory of the calculation, FileSource,
+                or DirectoryListing, whose headers are reused
+            parser_class - DFTParser subclass, parser of the calculation
+            options - conversion options that change the pif (e.g., quality_report)
+        Returns:
+            String, key of the calculation
+        '''
+        h = hashlib.sha256()
+        parser_name = '%s.%s' % (parser_class.__module__, parser_class.__name__)
+        h.update(json.dumps([__version__, parser_name, get_parser_version(parser_class),
+                             sorted(options.items())]).encode('utf-8'))
+        listing = directory if isinstance(directory, DirectoryListing) else DirectoryListing(directory)
+        for f in sorted(parser_class.list_input_files(listing)):
+            h.update(('\n%s\0' % f).encode('utf-8'))
+            with listing.source.open_raw(f) as fp:
+                for block in iter(lambda: fp.read(1 << 20), b''):
+                    h.update(block)
+        return h.hexdigest()
+
+    def get(self, key):
+        '''Get the pif of a calculation
+
+        Input:
+            key - String, key of the calculation (see make_key)
+        Returns:
+            pif - ChemicalSystem, or None if the calculation is not in the cache
+        '''
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+        result = pif.loads(json.dumps(entry['pif']))
+        if 'quality_report' in entry:
+            setattr(result, 'quality_report', entry['quality_report'])
+        return result
+
+    def put(self, key, result):
+        '''Store the pif of a calculation, evicting the least recently used entries if needed
+
+        Input:
+            key - String, key of the calculation (see make_key)
+            result - ChemicalSystem, pif of the calculation
+        '''
+        entry = {'pif': json.loads(pif.dumps(result))}
+        if hasattr(result, 'quality_report'):
+            entry['quality_report'] = result.quality_report
+        self.put_entry(key, entry)
+
+
+class ReportCache(DiskCache):
+    '''On-disk cache of quality reports, whose entries expire after 30 days by default'''
+
+    def __init__(self, directory, max_size=1 << 26, ttl=30 * 24 * 3600):
+        super(ReportCache, self).__init__(directory, max_size, ttl)
+
+    @staticmethod
+    def make_key(files, url, inline):
+        '''Compute the key of a quality report from the contents of the files that are scored
+
+        Input:
+            files - list of (String, bytes), names and contents of the files (see
+                dfttopif.report.read_report_files)
+            url - String, address of the service
+            inline - bool, whether the report is a JSON object, rather than text
+        Returns:
+            String, key of the report
+        '''
+        h = hashlib.sha256()
+        h.update(json.dumps([url, inline]).encode('utf-8'))
+        for name, data in files:
+            h.update(('\n%s\0%d\0' % (name, len(data))).encode('utf-8'))
+            h.update(data)
+        return h.hexdigest()
+
+    def get(self, key):
+        '''Get a quality report
+
+        Input:
+            key - String, key of the report (see make_key)
+        Returns:
+            (report, score), or None if the report is not in the cache or has expired
+        '''
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+        return entry['report'], entry['score']
+
+    def put(self, key, report, score):
+        '''Store a quality report
+
+        Input:
+            key - String, key of the report (see make_key)
+            report - dict or String, report returned by the service
+            score - int, score of the calculation
+        '''
+        self.put_entry(key, {'report': report, 'score': score})
+
+
+_default_caches = {}
+_default_lock = threading.Lock()
+
+
+def get_default_cache():
+    '''Get the cache configured with the DFTTOPIF_CACHE and DFTTOPIF_CACHE_SIZE environment variables
+
+    Returns:
+        PifCache, or None if DFTTOPIF_CACHE is not set
+    '''
+    directory = os.environ.get('DFTTOPIF_CACHE')
+    if not directory:
+        return None
+    max_size = int(os.environ.get('DFTTOPIF_CACHE_SIZE', 1 << 30))
+    with _default_lock:
+        if (directory, max_size) not in _default_caches:
+            _default_caches[(directory, max_size)] = PifCache(directory, max_size)
+        return _default_caches[(directory, max_size)]
+
+
+def get_default_report_cache():
+    '''Get the cache of quality reports configured with the DFTTOPIF_REPORT_CACHE,
+    DFTTOPIF_REPORT_CACHE_SIZE and DFTTOPIF_REPORT_CACHE_TTL environment variables
+
+    Returns:
+        ReportCache, or None if DFTTOPIF_REPORT_CACHE is not set
+    '''
+    directory = os.environ.get('DFTTOPIF_REPORT_CACHE')
+    if not directory:
+        return None
+    max_size = int(os.environ.get('DFTTOPIF_REPORT_CACHE_SIZE', 1 << 26))
+    ttl = float(os.environ.get('DFTTOPIF_REPORT_CACHE_TTL', 30 * 24 * 3600))
+    with _default_lock:
+        if ('report', directory, max_size, ttl) not in _default_caches:
+            _default_caches[('report', directory, max_size, ttl)] = ReportCache(directory, max_size, ttl)
+        return _default_caches[('report', directory, max_size, ttl)]
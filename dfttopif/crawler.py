@@ -0,0 +1,88 @@
+'''Tools to find the calculations in a tree of directories'''
+
+import os
+import fnmatch
+from dfttopif.parsers import detect_parser
+from dfttopif.parsers.registry import DirectoryListing
+from dfttopif.drivers import directories_to_pifs
+
+default_prune = ['.*', '__pycache__', '*.save']
+'''Patterns of the names of directories that are never walked into, such as hidden
+directories and the scratch directories of PWSCF'''
+
+archive_patterns = ['*.tar', '*.tar.gz', '*.tgz', '*.tar.bz2', '*.tbz2', '*.tar.xz', '*.txz', '*.tar.zst', '*.zip']
+'''Patterns of the names of archive files that may hold a calculation'''
+
+
+def find_calculations(root, prune=None, descend_into_calculations=False, include_archives=False,
+                      follow_symlinks=False, onerror=None):
+    '''Walk a tree of directories, yielding the calculations found along the way
+
+    Each directory is listed once with os.scandir, and matched against the signature
+    rules of the registered parsers, which at most reads the start of a few files.
+    Directories are yielded as soon as they are found, so the walk can feed the
+    conversion of the calculations (see crawl_to_pifs).
+
+    Input:
+        root - String, path to the top of the tree
+        prune - list of String, glob patterns of directory names to skip. Defaults to `default_prune`
+        descend_into_calculations - bool, whether to look for other calculations inside
+            the directory of a calculation
+        include_archives - bool, whether to also yield archive files (see `archive_patterns`),
+            which are not inspected
+        follow_symlinks - bool, whether to walk into symbolic links to directories
+        onerror - function, called with the OSError raised when a directory cannot be listed.
+            By default, such directories are skipped
+
+    Output:
+        Generator of String, paths to the directories of calculations and archives
+    '''
+    if prune is None:
+        prune = default_prune
+    stack = [root]
+    while stack:
+        directory = stack.pop()
+        files = [] ; subdirs = []
+        try:
+            for entry in os.scandir(directory):
+                if entry.is_dir(follow_symlinks=follow_symlinks):
+                    if not any([fnmatch.fnmatch(entry.name, p) for p in prune]):
+                        subdirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.name)
+        except OSError as e:
+            if onerror is not None:
+                onerror(e)
+            continue
+
+        if detect_parser(DirectoryListing(directory, files)) is not None:
+            yield directory
+            if not descend_into_calculations:
+                continue
+
+        if include_archives:
+            for f in sorted(files):
+                if any([fnmatch.fnmatch(f, p) for p in archive_patterns]):
+                    yield os.path.join(directory, f)
+
+        # Walk the subdirectories in alphabetical order
+        stack.extend(sorted(subdirs, reverse=True))
+
+
+def crawl_to_pifs(root, prune=None, descend_into_calculations=False, include_archives=False, **kwargs):
+    '''Find the calculations in a tree of directories and convert them to pifs
+
+    The conversion of the first calculations starts while the rest of the tree is
+    still being walked.
+
+    Input:
+        root - String, path to the top of the tree
+        prune, descend_into_calculations, include_archives - see find_calculations
+        kwargs - any additional keyword arguments of directories_to_pifs and directory_to_pif
+
+    Output:
+        Generator of (path, pif or Exception) tuples, see directories_to_pifs
+    '''
+    paths = find_calculations(root, prune=prune, descend_into_calculations=descend_into_calculations,
+                              include_archives=include_archives)
+    return directories_to_pifs(paths, **kwargs)
@@ -1,34 +1,36 @@
 import os
+import copy
 import uuid
-import tarfile
 import shutil
+import tarfile
+import zipfile
+import contextlib
+import warnings
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
 from dfttopif.parsers import VaspParser
 from dfttopif.parsers import PwscfParser
+from dfttopif.parsers import detect_parser
+from dfttopif.parsers.registry import DirectoryListing
+from dfttopif.parsers.base import DirectorySource, TarSource, ZipSource, StreamTarSource, as_source, open_file
+from dfttopif.cache import get_default_cache
+from dfttopif.tarindex import IndexedTarSource, is_gzip_file, indexed_gzip
+from dfttopif.report import get_default_client
 from pypif.obj import *
 import json
 
 
-def _add_quality_report(directory, pif, inline=True):
-    import tarfile
-    tar = tarfile.open("tmp.tar", "w")
-    tar.add(os.path.join(directory, "OUTCAR"))
-    tar.add(os.path.join(directory, "INCAR"))
-    tar.close()
-
-    import requests
-    if inline:
-        r = requests.post('https://calval.citrination.com/validate/json/tarfile', data=open('tmp.tar', 'rb').read())
-        report = json.loads(r.json()[0])
-        score = report["score"]
-    else:
-        r = requests.post('https://calval.citrination.com/validate/tarfile', data=open('tmp.tar', 'rb').read())
-        report = r.json()[0]
-        score = int(report.split('\n')[0].split()[-1]) # the score is the last token on the first line
-    os.remove("tmp.tar")
-
-    if r.status_code != requests.codes.ok:
-        print("Unable to generate quality report; request returned with status {}".format(r.status_code))
+def _add_quality_report(directory, pif, inline=True, client=None):
+    source = as_source(directory)
+    if not inline and not isinstance(source, DirectorySource):
+        raise ValueError("The quality report can only be written to a directory on disk")
+    directory = source.root
+    if client is None:
+        client = get_default_client()
+    result = client.report(source, inline)
+    if result is None:
         return
+    report, score = result
 
     if inline:
         setattr(pif, "quality_report", report)
@@ -48,77 +50,247 @@ def _add_quality_report(directory, pif, inline=True):
 
     return pif
 
-def tarfile_to_pif(filename, temp_root_dir='', verbose=0):
+def tarfile_to_pif(filename, temp_root_dir='', verbose=0, extract=False, exclude=None, seek_index=False, **kwargs):
     """
     Process a tar file that contains DFT data.
 
+    By default, the files are read straight from the archive, and nothing is written
+    to disk. A compressed archive is decompressed once, in a single pass, keeping in
+    memory the members that may belong to the calculation and are not excluded. If the
+    files have to be extracted, only those read by the detected parser are.
+
+    Input:
+        filename - String, Path to the file to process.
+        temp_root_dir - String, Directory in which to extract files. Defaults to working directory.
+        verbose - int, How much status messages to print
+        extract - bool, whether to extract the files read by the parser to a temporary
+            directory, rather than reading them from the archive
+        exclude - list of String, glob patterns of the names of members that are
+            ignored. Defaults to dfttopif.parsers.base.archive_exclude (wavefunctions,
+            charge densities, etc.)
+        seek_index - bool, whether to read a gzip-compressed archive using its index
+            (see dfttopif.tarindex), which is built and saved next to the archive the
+            first time. Repeated conversions then do not scan the whole archive.
+            Requires indexed_gzip; without it, a warning is issued and the archive
+            is read in a single pass
+        kwargs - any additional keyword arguments of directory_to_pif
+
+    Output:
+        pif - ChemicalSystem, Results and settings of
+            the DFT calculation in pif format
+    """
+    with _tar_source(filename, exclude, seek_index) as source:
+        return _source_to_pif(source, temp_root_dir, verbose, extract, kwargs)
+
+
+def zipfile_to_pif(filename, temp_root_dir='', verbose=0, extract=False, exclude=None, **kwargs):
+    """
+    Process a zip file that contains DFT data.
+
+    The files are read straight from the archive, as in tarfile_to_pif.
+
     Input:
         filename - String, Path to the file to process.
-        temp_root_dir - String, Directory in which to save temporary files. Defaults to working directory.
+        temp_root_dir - String, Directory in which to extract files. Defaults to working directory.
         verbose - int, How much status messages to print
+        extract - bool, whether to extract the files read by the parser to a temporary directory
+        exclude - list of String, glob patterns of the names of members that are ignored
+        kwargs - any additional keyword arguments of directory_to_pif
 
     Output:
         pif - ChemicalSystem, Results and settings of
             the DFT calculation in pif format
     """
+    with _zip_source(filename, exclude) as source:
+        return _source_to_pif(source, temp_root_dir, verbose, extract, kwargs)
+
+
+@contextlib.contextmanager
+def _tar_source(filename, exclude=None, seek_index=False):
+    '''Open the calculation in a tar archive (see tarfile_to_pif)'''
+    if seek_index and is_gzip_file(filename) and indexed_gzip is None:
+        warnings.warn('indexed_gzip is not installed, so %s is read in a single pass rather than '
+                      'with its seek index' % filename)
+        seek_index = False
+    if seek_index and is_gzip_file(filename):
+        source = IndexedTarSource(filename, exclude=exclude)
+        try:
+            yield source
+        finally:
+            source.close()
+    elif _is_zstd_tarfile(filename) or _is_compressed_tarfile(filename):
+        # Compressed streams can only be read in order, so the archive is read once. tarfile
+        # decompresses gzip, bzip2 and xz itself, but not zstd
+        opener = open_file if _is_zstd_tarfile(filename) else open
+        with opener(filename, 'rb') as fp:
+            source = StreamTarSource(fp, exclude)
+        try:
+            yield source
+        finally:
+            source.close()
+    else:
+        with tarfile.open(filename, 'r') as tar:
+            # The calculation is in the first directory of the archive, if any
+            source = TarSource(tar, TarSource.find_root(tar), exclude)
+            try:
+                yield source
+            finally:
+                source.close()
+
+
+@contextlib.contextmanager
+def _directory_source(path):
+    '''Open the calculation in a directory on disk'''
+    yield DirectorySource(path)
+
+
+@contextlib.contextmanager
+def _zip_source(filename, exclude=None):
+    '''Open the calculation in a zip archive'''
+    with zipfile.ZipFile(filename) as zf:
+        yield ZipSource(zf, ZipSource.find_root(zf), exclude)
+
+
+def open_source(path, exclude=None, seek_index=False):
+    '''Open the files of a calculation, in a directory or in an archive
+
+    Input:
+        path - String, path to a directory or an archive file
+        exclude - list of String, glob patterns of the names of archive members that are ignored
+        seek_index - bool, whether to read gzip-compressed tar archives using their index
+    Returns:
+        context manager giving the FileSource of the calculation
+    '''
+    if os.path.isdir(path):
+        return _directory_source(path)
+    if tarfile.is_tarfile(path) or _is_zstd_tarfile(path):
+        return _tar_source(path, exclude, seek_index)
+    if zipfile.is_zipfile(path):
+        return _zip_source(path, exclude)
+    raise Exception('Cannot process file type')
+
+
+def _source_to_pif(source, temp_root_dir, verbose, extract, kwargs):
+    '''Convert the calculation in an archive, either from the archive or by extracting
+    only the files read by its parser'''
+    if not extract:
+        return directory_to_pif(source, verbose, **kwargs)
+
+    listing = DirectoryListing(source)
+    parser_class = detect_parser(listing)
+    if parser_class is None:
+        raise Exception('Directory is not in correct format for an existing parser')
     temp_dir = temp_root_dir + str(uuid.uuid4())
-    os.makedirs(temp_dir)
+    directory = os.path.join(temp_dir, source.root)
+    os.makedirs(directory)
     try:
-        tar = tarfile.open(filename, 'r')
-        tar.extractall(path=temp_dir)
-        tar.close()
-        for i in os.listdir(temp_dir):
-            cur_dir = temp_dir + '/' + i
-            if os.path.isdir(cur_dir):
-                return directory_to_pif(cur_dir, verbose)
-        return directory_to_pif(temp_dir, verbose)
+        for f in parser_class.list_input_files(listing):
+            with source.open_raw(f) as fp, open(os.path.join(directory, f), 'wb') as out:
+                shutil.copyfileobj(fp, out)
+        return directory_to_pif(directory, verbose, **kwargs)
     finally:
         shutil.rmtree(temp_dir)
 
 
-def archive_to_pif(filename, verbose=0):
+def _is_zstd_tarfile(filename):
+    '''Whether a file is a tar archive compressed with zstd, judging by its name'''
+    return filename.endswith('.tar.zst')
+
+
+_compressed_magic = (b'\x1f\x8b', b'BZh', b'\xfd7zXZ\x00')
+'''First bytes of files compressed with gzip, bzip2 and xz'''
+
+
+def _is_compressed_tarfile(filename):
+    '''Whether a tar archive is compressed with gzip, bzip2 or xz, judging by its first bytes'''
+    with open(filename, 'rb') as fp:
+        start = fp.read(6)
+    return any([start.startswith(m) for m in _compressed_magic])
+
+
+def archive_to_pif(filename, verbose=0, **kwargs):
     """
     Given a archive file that contains output from a DFT calculation, parse the data and return a PIF object.
 
+    Tar archives (uncompressed, or compressed with gzip, bzip2, xz or zstd) and zip
+    archives are supported.
+
     Input:
         filename - String, Path to the file to process.
         verbose - int, How much status messages to print
+        kwargs - any additional keyword arguments of tarfile_to_pif
 
     Output:
         pif - ChemicalSystem, Results and settings of
             the DFT calculation in pif format
     """
-    if tarfile.is_tarfile(filename):
-        return tarfile_to_pif(filename, verbose)
+    if tarfile.is_tarfile(filename) or _is_zstd_tarfile(filename):
+        return tarfile_to_pif(filename, verbose=verbose, **kwargs)
+    if zipfile.is_zipfile(filename):
+        return zipfile_to_pif(filename, verbose=verbose, **kwargs)
     raise Exception('Cannot process file type')
 
 
-def directory_to_pif(directory, verbose=0, quality_report=True, inline=True):
+def directory_to_pif(directory, verbose=0, quality_report=True, inline=True, cache=None, report_client=None):
     '''Given a directory that contains output from
     a DFT calculation, parse the data and return
     a pif object
 
     Input:
         directory - String, path to directory containing
-            DFT results
+            DFT results, or FileSource giving access to the files
+            (e.g., in an archive)
         verbose - int, How much status messages to print
+        cache - PifCache, cache of the pifs of the calculations that were already
+            converted. Defaults to the cache configured with the DFTTOPIF_CACHE
+            environment variable, if any. Only used when inline is True, as pifs
+            otherwise refer to files by their path
+        report_client - dfttopif.report.QualityReportClient, client used to request the
+            quality report of VASP calculations. Defaults to that of the service at the
+            address given by the DFTTOPIF_REPORT_URL environment variable, if any
 
     Output:
         pif - ChemicalSystem, Results and settings of
             the DFT calculation in pif format
     '''
 
-    # Look for the first parser compatible with the directory
-    foundParser = False
-    for possible_parser in [VaspParser, PwscfParser]:
-        try:
-            parser = possible_parser(directory)
-            if parser.test_if_from(directory):
-                foundParser = True
-                break
-        except: pass
-    if not foundParser:
+    # Look for the best parser compatible with the directory. The listing, with the start
+    # of the files read during detection, is shared with the cache and the parser
+    listing = DirectoryListing(directory)
+    parser_class = detect_parser(listing)
+    if parser_class is None:
         raise Exception('Directory is not in correct format for an existing parser')
+
+    # Look for the pif in the cache, before parsing anything
+    if cache is None:
+        cache = get_default_cache()
+    key = None
+    if cache is not None and inline:
+        key = cache.make_key(listing, parser_class,
+                             quality_report=quality_report and issubclass(parser_class, VaspParser))
+        chem = cache.get(key)
+        if chem is not None:
+            return chem
+
+    parser = parser_class(listing)
+    try:
+        chem = _parser_to_pif(parser, verbose, inline)
+    finally:
+        # Release the files mapped by the parser now, rather than when it is garbage collected
+        parser.close()
+
+    # Check to see if we should add the quality report
+    if quality_report and isinstance(parser, VaspParser) :
+        if _add_quality_report(listing.source, chem, client=report_client) is None:
+            key = None # do not cache a pif without its report
+
+    if key is not None:
+        cache.put(key, chem)
+
+    return chem
+
+def _parser_to_pif(parser, verbose, inline):
+    '''Gather the settings and results read by a parser into a pif (see directory_to_pif)'''
     if verbose > 0:
         print("Found a %s directory", parser.get_name())
         
@@ -147,6 +319,9 @@ def directory_to_pif(directory, verbose=0, quality_report=True, inline=True):
         if inline and cond.files is not None:
             continue
 
+        # Copy the condition, which is cached by the parser
+        cond = copy.copy(cond)
+
         # Set the name
         cond.name = name
 
@@ -166,6 +341,9 @@ def directory_to_pif(directory, verbose=0, quality_report=True, inline=True):
         if inline and prop.files is not None:
             continue
 
+        # Copy the property, which is cached by the parser
+        prop = copy.copy(prop)
+
         # Add name and other data
         prop.name = name
         prop.methods = [method,]
@@ -177,17 +355,176 @@ def directory_to_pif(directory, verbose=0, quality_report=True, inline=True):
         else:
             if not isinstance(prop.conditions, list):
                 prop.conditions = [prop.conditions]
-            prop.conditions.extend(conditions)
+            prop.conditions = prop.conditions + conditions
 
         # Add it to the output
         chem.properties.append(prop)
 
-    # Check to see if we should add the quality report
-    if quality_report and isinstance(parser, VaspParser) :
-        _add_quality_report(directory, chem)
-
     return chem
 
+
+def path_to_pif(path, **kwargs):
+    '''Convert either a directory or an archive of a DFT calculation to a pif
+
+    Input:
+        path - String, path to a directory or an archive file
+        kwargs - any additional keyword arguments of directory_to_pif
+
+    Output:
+        pif - ChemicalSystem, Results and settings of
+            the DFT calculation in pif format
+    '''
+    if os.path.isdir(path):
+        return directory_to_pif(path, **kwargs)
+    return archive_to_pif(path, **kwargs)
+
+
+def _convert_path(path, kwargs):
+    '''Convert a path in a worker of directories_to_pifs, returning the error instead of raising it'''
+    try:
+        return path, path_to_pif(path, **kwargs)
+    except Exception as e:
+        return path, e
+
+
+def directories_to_pifs(paths, max_workers=None, processes=True, ordered=True, max_pending=None, manifest=None,
+                        report_workers=0, report_client=None, **kwargs):
+    '''Convert many directories or archives of DFT calculations to pifs in parallel
+
+    Paths are read from the iterable as workers become free, so it may be a
+    generator that is still producing paths. At most `max_pending` conversions are
+    in flight at any time, which keeps memory usage flat for any number of paths.
+
+    Input:
+        paths - iterable of String, paths to directories or archive files
+        max_workers - int, number of workers. Defaults to the number of processors
+        processes - bool, whether to convert in a pool of processes (True) or threads (False)
+        ordered - bool, whether to yield the results in the order of `paths`. Otherwise,
+            results are yielded as soon as they are ready
+        max_pending - int, maximum number of conversions submitted but not yet yielded.
+            Defaults to twice the number of workers
+        manifest - dfttopif.manifest.Manifest, record of the previous conversions. If given,
+            paths whose files have not changed since they were converted are skipped, and
+            each conversion is recorded once the caller has moved on to the next result,
+            so that an interrupted run resumes where it stopped
+        report_workers - int, number of threads requesting the quality reports of VASP
+            calculations in a separate stage, so that conversions do not wait for the
+            service. By default, each conversion requests its own report
+        report_client - dfttopif.report.QualityReportClient, client used by the
+            report stage. Defaults to that given by get_default_client
+        kwargs - any additional keyword arguments of directory_to_pif
+
+    Output:
+        Generator of (path, pif or Exception) tuples, where the exception is the
+            error raised when converting that path
+    '''
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_pending is None:
+        max_pending = 2 * max_workers
+    if max_pending < 1:
+        raise ValueError("max_pending must be at least 1")
+
+    defer_reports = report_workers > 0 and kwargs.get('quality_report', True)
+    if defer_reports:
+        if report_client is None:
+            report_client = get_default_client()
+        kwargs = dict(kwargs, quality_report=False)
+
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    paths = iter(paths)
+    # The conversions are shut down first, as they hand their results over to the reports
+    with ThreadPoolExecutor(max_workers=max(report_workers, 1)) as reporter, \
+            executor_class(max_workers=max_workers) as executor:
+        pending = deque() # (path, fingerprint, future) of the conversions in flight
+
+        def convert_path(path):
+            future = executor.submit(_convert_path, path, kwargs)
+            if defer_reports:
+                future = _then_report(future, path, reporter, report_client, kwargs)
+            return future
+
+        def submit():
+            for path in paths:
+                fingerprint = None
+                if manifest is not None:
+                    try:
+                        fingerprint = manifest.fingerprint(path)
+                    except OSError:
+                        pass # let the conversion report the error
+                    if manifest.is_current(path, fingerprint):
+                        continue
+                pending.append((path, fingerprint, convert_path(path)))
+                return
+
+        for i in range(max_pending):
+            submit()
+
+        while pending:
+            if ordered:
+                done = [pending.popleft()]
+            else:
+                finished = wait([f for p, h, f in pending], return_when=FIRST_COMPLETED)[0]
+                done = [item for item in pending if item[2] in finished]
+                for item in done:
+                    pending.remove(item)
+            for path, fingerprint, future in done:
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # e.g., the worker process died or the pif could not be sent back
+                    result = (path, e)
+                submit()
+                yield result
+                if manifest is not None:
+                    error = result[1] if isinstance(result[1], Exception) else None
+                    manifest.record(path, fingerprint, error)
+
+
+def _then_report(future, path, reporter, client, kwargs):
+    '''Request the quality report of a calculation once it is converted
+
+    Input:
+        future - Future, conversion of the calculation (see _convert_path)
+        path - String, path to the calculation
+        reporter - Executor, where the reports are requested
+        client - QualityReportClient, client of the service
+        kwargs - keyword arguments of the conversion
+    Returns:
+        Future, giving the (path, pif or Exception) of the calculation with its report
+    '''
+    result = Future()
+
+    def converted(f):
+        try:
+            pif = f.result()[1]
+        except Exception as e:
+            # e.g., the worker process died or the pif could not be sent back
+            result.set_result((path, e))
+            return
+        if isinstance(pif, Exception):
+            result.set_result((path, pif))
+            return
+        report = reporter.submit(_report_path, path, pif, client, kwargs)
+        report.add_done_callback(lambda r: result.set_result(r.result()))
+
+    future.add_done_callback(converted)
+    return result
+
+
+def _report_path(path, pif, client, kwargs):
+    '''Add the quality report to the pif of a calculation, if it was made with VASP,
+    returning the error instead of raising it'''
+    try:
+        with open_source(path, kwargs.get('exclude'), kwargs.get('seek_index', False)) as source:
+            parser_class = detect_parser(source)
+            if parser_class is not None and issubclass(parser_class, VaspParser):
+                _add_quality_report(source, pif, kwargs.get('inline', True), client)
+    except Exception as e:
+        return path, e
+    return path, pif
+
+
 def convert(files=[], **kwargs):
     """
     Wrap directory to pif as a dice extension
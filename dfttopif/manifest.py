@@ -0,0 +1,112 @@
+'''Manifest of converted calculations, for incremental and resumable batch conversion
+
+The manifest is a SQLite database that records, for each calculation, a fingerprint
+of the files read by its parser (name, size, modification time and, optionally, a
+hash of the contents) and whether its conversion succeeded. Calculations whose
+fingerprint is unchanged since the last run are skipped.
+'''
+
+import os
+import time
+import hashlib
+import sqlite3
+from dfttopif.parsers.registry import get_input_files
+
+
+def fingerprint(path, hash_contents=False):
+    '''Compute a fingerprint of the files read to convert a calculation
+
+    Input:
+        path - String, path to a directory or an archive file
+        hash_contents - bool, whether to include a hash of the contents of the files,
+            rather than only their size and modification time
+    Returns:
+        String, hex digest of the fingerprint
+    '''
+    h = hashlib.sha256()
+    for f in get_input_files(path):
+        st = os.stat(f)
+        h.update(('%s\0%d\0%d\n' % (os.path.basename(f), st.st_size, st.st_mtime_ns)).encode('utf-8'))
+        if hash_contents:
+            with open(f, 'rb') as fp:
+                for block in iter(lambda: fp.read(1 << 20), b''):
+                    h.update(block)
+    return h.hexdigest()
+
+
+class Manifest(object):
+    '''SQLite manifest of the calculations that have been converted
+
+    A connection should only be used from the thread that created it.
+    directories_to_pifs only uses it from the thread that iterates over the results.
+    '''
+
+    def __init__(self, filename, hash_contents=False, retry_errors=False):
+        '''Open a manifest, creating it if needed
+
+        Input:
+            filename - String, path to the SQLite database
+            hash_contents - bool, whether fingerprints include a hash of the contents of the files
+            retry_errors - bool, whether to convert again calculations that failed, even if unchanged
+        '''
+        self.hash_contents = hash_contents
+        self.retry_errors = retry_errors
+        self._db = sqlite3.connect(filename)
+        with self._db:
+            self._db.execute('CREATE TABLE IF NOT EXISTS calculations ('
+                             'path TEXT PRIMARY KEY, fingerprint TEXT, status TEXT, error TEXT, updated REAL)')
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def fingerprint(self, path):
+        '''Compute the fingerprint of a calculation, see fingerprint()'''
+        return fingerprint(path, self.hash_contents)
+
+    def get(self, path):
+        '''Get the record of a calculation
+
+        Input:
+            path - String, path to the calculation
+        Returns:
+            dict with the fingerprint, status ("done" or "error"), error and time of the
+                last conversion, or None if the calculation was never converted
+        '''
+        row = self._db.execute('SELECT fingerprint, status, error, updated FROM calculations WHERE path = ?',
+                               (os.path.abspath(path),)).fetchone()
+        if row is None:
+            return None
+        return dict(zip(['fingerprint', 'status', 'error', 'updated'], row))
+
+    def is_current(self, path, fingerprint):
+        '''Check whether a calculation was converted and has not changed since
+
+        Input:
+            path - String, path to the calculation
+            fingerprint - String, current fingerprint of the calculation
+        Returns:
+            boolean, whether the calculation can be skipped
+        '''
+        record = self.get(path)
+        if fingerprint is None or record is None or record['fingerprint'] != fingerprint:
+            return False
+        return record['status'] == 'done' or not self.retry_errors
+
+    def record(self, path, fingerprint, error=None):
+        '''Record the conversion of a calculation
+
+        Input:
+            path - String, path to the calculation
+            fingerprint - String, fingerprint of the calculation when it was converted
+            error - Exception, raised by the conversion if it failed
+        '''
+        with self._db:
+            self._db.execute('INSERT OR REPLACE INTO calculations VALUES (?, ?, ?, ?, ?)',
+                             (os.path.abspath(path), fingerprint, 'done' if error is None else 'error',
+                              None if error is None else repr(error), time.time()))
@@ -2,3 +2,7 @@
 
 from .vasp import VaspParser
 from .pwscf import PwscfParser
+from .registry import register_parser, get_parsers, detect_parser, detect_parsers
+
+register_parser(VaspParser)
+register_parser(PwscfParser)
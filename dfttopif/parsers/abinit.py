@@ -1,5 +1,4 @@
-from .base import DFTParser
-import os
+from .base import DFTParser, as_source
 import glob
 from ase.calculators.abinit import Abinit
 from pypif.obj.common import Value, Property, Scalar
@@ -14,10 +13,10 @@ class AbinitParser(DFTParser):
     
     def test_if_from(self, directory):
         # Check whether any file has as name ABINIT in the file in the first two lines
-        files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-        for f in files:
+        source = as_source(directory)
+        for f in source.list_files():
             try:
-                with open(os.path.join(directory, f), 'r') as fp:
+                with source.open_file(f) as fp:
                     for line in [fp.readline(), fp.readline()]:
                         if "ABINIT" in line:
                             return True
@@ -30,14 +29,14 @@ class AbinitParser(DFTParser):
          for this calculation
         '''
         if self._label is None:
-            files = [f for f in os.listdir(self._directory) if os.path.isfile(os.path.join(self._directory, f))] 
+            files = self._source.list_files()
             foundfiles = False
             print(files)
             for f in files:
                 if ".files" in f: 
                     foundfiles = True
                     self._label = f.split(".")[0]
-                    fp = open(os.path.join(self._directory, self._label + '.files'), 'r')
+                    fp = self._source.open_file(self._label + '.files')
                     line = fp.readline().split()[0]
                     if line != self._label + ".in":
                        fp.close()
@@ -73,7 +72,7 @@ class AbinitParser(DFTParser):
         if not self._label:
             self._get_label()
         # Open up the label.txt file
-        fp = open(os.path.join(self._directory, self._label + '.out'), 'r')
+        fp = self._source.open_file(self._label + '.out')
         foundecho = False 
         # Look for ecut after the occurence of "echo values of preprocessed input variables"
         for line in fp:
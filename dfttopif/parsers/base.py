@@ -1,7 +1,152 @@
 import os
+import io
+import fnmatch
+import functools
+import bz2
+import gzip
+import mmap
+import shutil
+import tarfile
+import tempfile
 from collections import Counter
 from pypif.obj.common import Value, Property, Scalar
 
+try:
+    import lzma
+except ImportError:
+    lzma = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def _open_zstd(path):
+    if zstandard is None:
+        raise Exception('zstandard is required to read %s' % path)
+    return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(open(path, 'rb'), closefd=True))
+
+
+def _open_xz(path):
+    if lzma is None:
+        raise Exception('lzma is required to read %s' % path)
+    return lzma.open(path, 'rb')
+
+
+_decompressors = {
+    '.gz': lambda path: gzip.open(path, 'rb'),
+    '.bz2': lambda path: bz2.BZ2File(path, 'rb'),
+    '.xz': _open_xz,
+    '.zst': _open_zstd,
+}
+'''Functions that open a compressed file for binary reading, by file extension'''
+
+
+def _wrap_zstd(fp):
+    if zstandard is None:
+        raise Exception('zstandard is required to read compressed files with the .zst extension')
+    return io.BufferedReader(zstandard.ZstdDecompressor().stream_reader(fp, closefd=True))
+
+
+def _wrap_xz(fp):
+    if lzma is None:
+        raise Exception('lzma is required to read compressed files with the .xz extension')
+    return lzma.LZMAFile(fp, 'rb')
+
+
+_compressed_types = (gzip.GzipFile, bz2.BZ2File) + ((lzma.LZMAFile,) if lzma is not None else ())
+'''Types of the decompressed streams of archives, which can only be seeked backwards by decompressing again'''
+
+
+_stream_decompressors = {
+    '.gz': lambda fp: gzip.GzipFile(fileobj=fp, mode='rb'),
+    '.bz2': lambda fp: bz2.BZ2File(fp, 'rb'),
+    '.xz': _wrap_xz,
+    '.zst': _wrap_zstd,
+}
+'''Functions that decompress a binary file object on the fly, by file extension'''
+
+
+def is_compressed(path):
+    '''Whether a file will be decompressed on the fly by `open_file`'''
+    return os.path.splitext(path)[1] in _decompressors
+
+
+def find_file(directory, name):
+    '''Find a file in a directory, or a compressed copy of it
+
+    Input:
+        directory - String, path to the directory
+        name - String, name of the file (e.g., "OUTCAR")
+    Returns:
+        String, path to the file (e.g., "directory/OUTCAR.gz"), or None if not found
+    '''
+    path = os.path.join(directory, name)
+    if os.path.isfile(path):
+        return path
+    for ext in sorted(_decompressors):
+        if os.path.isfile(path + ext):
+            return path + ext
+    return None
+
+
+def strip_compression(name):
+    '''Remove the extension of a compressed file from a file name (e.g., "OUTCAR.gz" -> "OUTCAR")'''
+    base, ext = os.path.splitext(name)
+    return base if ext in _decompressors else name
+
+
+_bulk_extensions = ('.wfc', '.dat', '.hdf5', '.upf', '.save', '.bin', '.cube', '.xsf', '.npy', '.tar', '.tgz', '.zip')
+'''Extensions (or their start) of files that are never inputs or outputs that can be sniffed,
+e.g. wavefunctions, charge densities and pseudopotentials'''
+
+
+archive_exclude = ['WAVECAR*', 'WAVEDER*', 'CHGCAR*', 'CHG', 'CHG.*', 'AECCAR*', 'LOCPOT*', 'ELFCAR*', 'PROCAR*',
+                   '*.save', '*.save/*', '*.wfc*', '*.hdf5']
+'''Default patterns of the names of archive members that are never read by the parsers, such as
+wavefunctions, charge densities and potentials'''
+
+
+def is_bulk_file(name):
+    '''Whether a file holds bulk data (see `_bulk_extensions`) that is not worth sniffing'''
+    ext = os.path.splitext(strip_compression(name))[1].lower()
+    return any([ext.startswith(i) for i in _bulk_extensions])
+
+
+def read_header(path, size=32768):
+    '''Read the start of a file, decompressing it if needed
+
+    Input:
+        path - String, path to the file
+        size - int, maximum number of bytes to read
+    Returns:
+        String, start of the file, or "" if it cannot be read
+    '''
+    try:
+        with open_file(path, 'rb') as fp:
+            header = fp.read(size)
+    except Exception:
+        return ''
+    return header.decode('utf-8', 'replace')
+
+
+def open_file(path, mode='r'):
+    '''Open a file for reading, decompressing it on the fly if its extension is that of
+    a compressed file (.gz, .bz2, .xz or .zst)
+
+    Input:
+        path - String, path to the file
+        mode - String, "r" to read text or "rb" to read bytes
+    Returns:
+        file object
+    '''
+    ext = os.path.splitext(path)[1]
+    if ext not in _decompressors:
+        return open(path, mode) if mode == 'rb' else io.open(path, 'r', errors='replace')
+    fp = _decompressors[ext](path)
+    return fp if mode == 'rb' else io.TextIOWrapper(fp, errors='replace')
+
 
 def Value_if_true(func):
     '''Returns:
@@ -9,6 +154,666 @@ def Value_if_true(func):
     return lambda x: Value() if func(x) == True else None
 
 
+def reverse_readlines(fp, block_size=65536):
+    '''Iterate over the lines of a file from the end, reading it block-wise
+
+    Quantities from the last step of a calculation sit near the end of the output, so
+    finding them this way takes a time independent of the number of steps.
+
+    Input:
+        fp - file object, opened in binary mode and seekable
+        block_size - int, number of bytes read at a time
+    Returns:
+        generator of strings, lines from the last to the first
+    '''
+    fp.seek(0, os.SEEK_END)
+    pos = fp.tell()
+    buf = b''
+    at_end = True
+    while pos > 0:
+        size = min(block_size, pos)
+        pos -= size
+        fp.seek(pos)
+        pieces = (fp.read(size) + buf).split(b'\n')
+        # The first piece may be the end of a line that started in an earlier block
+        buf = pieces.pop(0)
+        for piece in reversed(pieces):
+            if at_end:
+                # Text after the last line terminator, if any
+                at_end = False
+                if piece:
+                    yield piece.decode('utf-8', 'replace')
+            else:
+                yield (piece + b'\n').decode('utf-8', 'replace')
+    if not at_end:
+        yield (buf + b'\n').decode('utf-8', 'replace')
+    elif buf:
+        yield buf.decode('utf-8', 'replace')
+
+
+class IndexedFile(object):
+    '''Read-only, memory-mapped view of a text file
+
+    Lines are located by searching the mapped bytes for keywords, so that only the
+    regions of the file that are actually needed get paged in. The byte offsets of
+    the lines containing each keyword are computed on first request and cached.
+
+    Lines are returned as strings, including their line terminator.
+
+    Compressed files (see `open_file`) are decompressed once into an anonymous temporary
+    file, which is mapped instead. This costs one pass over the file and scratch space
+    of its decompressed size, in exchange for keyword lookups and jumps to any offset,
+    which a compressed stream does not allow. Read the file through `open` rather than
+    from its path, so that it is not decompressed again. The contents of a file can also
+    be given directly as bytes, e.g. for a file read from an archive.
+    '''
+
+    def __init__(self, path=None, data=None):
+        '''Map a file into memory
+
+        Input:
+            path - String, path to the file
+            data - bytes, contents of the file, used instead of reading `path`
+        '''
+        self._offsets = {}
+        if data is not None:
+            self._data = data
+        elif is_compressed(path):
+            with open_file(path, 'rb') as src:
+                with tempfile.TemporaryFile() as fp:
+                    shutil.copyfileobj(src, fp, 1 << 20)
+                    fp.flush()
+                    self._map(fp)
+        else:
+            with open(path, 'rb') as fp:
+                self._map(fp)
+
+    def close(self):
+        '''Release the memory map of the file, if any. The file cannot be read afterwards'''
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b''
+        self._offsets = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def _map(self, fp):
+        if os.fstat(fp.fileno()).st_size > 0:
+            self._data = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            # Empty files cannot be memory-mapped
+            self._data = b''
+
+    @staticmethod
+    def _encode(keyword):
+        return keyword.encode('utf-8')
+
+    def _line_start(self, pos):
+        '''Get the offset of the start of the line containing a position'''
+        return self._data.rfind(b'\n', 0, pos) + 1
+
+    def _line_end(self, pos):
+        '''Get the offset just past the end of the line containing a position'''
+        end = self._data.find(b'\n', pos)
+        return len(self._data) if end == -1 else end + 1
+
+    def offsets(self, keyword):
+        '''Get the offsets of all lines containing a keyword
+
+        Input:
+            keyword - String, substring to search for
+        Returns:
+            list of int, offset of the start of each matching line
+        '''
+        if keyword not in self._offsets:
+            needle = self._encode(keyword)
+            offsets = []
+            pos = self._data.find(needle, 0)
+            while pos != -1:
+                offsets.append(self._line_start(pos))
+                pos = self._data.find(needle, self._line_end(pos))
+            self._offsets[keyword] = offsets
+        return self._offsets[keyword]
+
+    def first_offset(self, keyword):
+        '''Get the offset of the first line containing a keyword, None if not found'''
+        if keyword in self._offsets:
+            offsets = self._offsets[keyword]
+            return offsets[0] if offsets else None
+        pos = self._data.find(self._encode(keyword), 0)
+        if pos == -1:
+            # Remember the keyword is absent, as finding that out reads the whole file
+            self._offsets[keyword] = []
+            return None
+        return self._line_start(pos)
+
+    def last_offset(self, keyword):
+        '''Get the offset of the last line containing a keyword, None if not found'''
+        if keyword in self._offsets:
+            offsets = self._offsets[keyword]
+            return offsets[-1] if offsets else None
+        pos = self._data.rfind(self._encode(keyword), 0)
+        if pos == -1:
+            self._offsets[keyword] = []
+            return None
+        return self._line_start(pos)
+
+    def __contains__(self, keyword):
+        return self.first_offset(keyword) is not None
+
+    def line(self, offset):
+        '''Get the line starting at a certain offset'''
+        return self._data[offset:self._line_end(offset)].decode('utf-8', 'replace')
+
+    def lines(self, offset=0):
+        '''Iterate over the lines of the file, starting at a certain offset'''
+        for offset, line in self.lines_with_offsets(offset):
+            yield line
+
+    def lines_with_offsets(self, offset=0):
+        '''Iterate over the lines of the file, starting at a certain offset
+
+        Returns:
+            generator of (int, String), offset and content of each line
+        '''
+        while offset < len(self._data):
+            end = self._line_end(offset)
+            yield offset, self._data[offset:end].decode('utf-8', 'replace')
+            offset = end
+
+    def first(self, keyword):
+        '''Get the first line containing a keyword, None if not found'''
+        offset = self.first_offset(keyword)
+        return None if offset is None else self.line(offset)
+
+    def last(self, keyword):
+        '''Get the last line containing a keyword, None if not found'''
+        offset = self.last_offset(keyword)
+        return None if offset is None else self.line(offset)
+
+    def all(self, keyword):
+        '''Get all lines containing a keyword'''
+        return [self.line(offset) for offset in self.offsets(keyword)]
+
+    def open(self, mode='rb', name=None):
+        '''Open the contents of the file for reading, without copying or decompressing them again
+
+        Input:
+            mode - String, "r" to read text or "rb" to read bytes
+            name - String, name of the text file (see `FileSource.open_file`)
+        Returns:
+            file object
+        '''
+        fp = io.BufferedReader(_BufferReader(self._data))
+        return fp if mode == 'rb' else _SourceTextFile(fp, name)
+
+    def head(self, keyword):
+        '''Get the part of the file before the first line containing a keyword
+
+        Searching the head for keywords that can only appear there (e.g., the settings
+        printed before the results) avoids reading the rest of the file when they are absent.
+
+        Input:
+            keyword - String, substring that marks the end of the head
+        Returns:
+            IndexedFile, holding a copy of the head, or this file if the keyword is not found
+        '''
+        offset = self.first_offset(keyword)
+        if offset is None:
+            return self
+        return IndexedFile(data=self._data[:offset])
+
+    def reverse_lines(self):
+        '''Iterate over the lines of the file, from the last to the first'''
+        if len(self._data) == 0:
+            return iter([])
+        if isinstance(self._data, bytes):
+            return reverse_readlines(io.BytesIO(self._data))
+        return reverse_readlines(self._data)
+
+
+class _BufferReader(io.RawIOBase):
+    '''Binary stream over bytes or a memory map, which are read in place'''
+
+    def __init__(self, data):
+        self._data = data
+        self._pos = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def readinto(self, b):
+        chunk = self._data[self._pos:self._pos + len(b)]
+        b[:len(chunk)] = chunk
+        self._pos += len(chunk)
+        return len(chunk)
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += len(self._data)
+        self._pos = max(offset, 0)
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+
+class _SourceTextFile(io.TextIOWrapper):
+    '''Text file read from a FileSource
+
+    Its name is the path of the file in the source, as some readers (e.g., that of ASE
+    for OUTCAR files) use it to find other files, while the members of archives have
+    no name, or that of the archive.
+    '''
+
+    name = None
+
+    def __init__(self, fp, name):
+        super(_SourceTextFile, self).__init__(fp, errors='replace')
+        self.name = name
+
+
+class FileSource(object):
+    '''Files of the directory of a calculation, wherever they are stored
+
+    Parsers read their files through this interface, rather than by path, so that the
+    same code reads a directory on disk (DirectorySource) or a directory inside an
+    archive (TarSource). Files are referred to by their name within the directory.
+    '''
+
+    root = ''
+    '''Path of the directory, used to name its files in the outputs and error messages'''
+
+    _names = None
+
+    def list_files(self):
+        '''List the names of the regular files of the directory'''
+        raise NotImplementedError
+
+    def close(self):
+        '''Release any storage held by the source (e.g., temporary copies of archive members)'''
+        pass
+
+    def open_raw(self, name):
+        '''Open a file for reading bytes, without decompressing it'''
+        raise NotImplementedError
+
+    def isfile(self, name):
+        '''Whether the directory holds a regular file with a certain name'''
+        if self._names is None:
+            self._names = set(self.list_files())
+        return name in self._names
+
+    def path(self, name):
+        '''Get the path of a file, relative to where the directory is stored'''
+        return os.path.join(self.root, name)
+
+    def find(self, name):
+        '''Find a file, or a compressed copy of it (see `find_file`)
+
+        Returns:
+            String, name of the file (e.g., "OUTCAR.gz"), or None if not found
+        '''
+        if self.isfile(name):
+            return name
+        for ext in sorted(_decompressors):
+            if self.isfile(name + ext):
+                return name + ext
+        return None
+
+    def open_file(self, name, mode='r'):
+        '''Open a file for reading, decompressing it on the fly if needed (see `open_file`)'''
+        fp = self.open_raw(name)
+        ext = os.path.splitext(name)[1]
+        if ext in _stream_decompressors:
+            fp = _stream_decompressors[ext](fp)
+        return fp if mode == 'rb' else _SourceTextFile(fp, self.path(name))
+
+    def read_header(self, name, size=32768):
+        '''Read the start of a file, decompressing it if needed (see `read_header`)'''
+        try:
+            with self.open_file(name, 'rb') as fp:
+                header = fp.read(size)
+        except Exception:
+            return ''
+        return header.decode('utf-8', 'replace')
+
+    def indexed(self, name):
+        '''Get an IndexedFile of a file, whose contents are read into memory'''
+        with self.open_file(name, 'rb') as fp:
+            return IndexedFile(data=fp.read())
+
+
+class DirectorySource(FileSource):
+    '''Files of a directory on disk'''
+
+    def __init__(self, directory):
+        '''Input:
+            directory - String, path to the directory
+        '''
+        self.root = directory
+
+    def list_files(self):
+        return [f for f in os.listdir(self.root) if os.path.isfile(os.path.join(self.root, f))]
+
+    def isfile(self, name):
+        return os.path.isfile(self.path(name))
+
+    def open_raw(self, name):
+        return open(self.path(name), 'rb')
+
+    def open_file(self, name, mode='r'):
+        return open_file(self.path(name), mode)
+
+    def read_header(self, name, size=32768):
+        return read_header(self.path(name), size)
+
+    def indexed(self, name):
+        return IndexedFile(self.path(name))
+
+
+class ArchiveSource(FileSource):
+    '''Files of a directory inside an archive, which are read without extracting them
+
+    Subclasses fill `_members`, which maps the names of the files to the members of the
+    archive, and implement `_open_member`.
+    '''
+
+    _members = None
+
+    spill_size = 1 << 24
+    '''Size in bytes above which members read ahead of their use are written to disk,
+    rather than kept in memory'''
+
+    _temp_dir = None
+    '''Temporary directory holding the members written to disk, deleted by close()'''
+
+    def member(self, name):
+        '''Get the archive member of a file'''
+        return self._members[name]
+
+    def list_files(self):
+        return list(self._members)
+
+    def isfile(self, name):
+        return name in self._members
+
+    def open_raw(self, name):
+        if name not in self._members:
+            raise IOError('%s does not exist' % self.path(name))
+        return self._open_member(self._members[name])
+
+    def _open_member(self, member):
+        '''Open a member of the archive for reading bytes'''
+        raise NotImplementedError
+
+    def _store(self, fp, size):
+        '''Keep a copy of a member that is read ahead of its use
+
+        Input:
+            fp - binary file object, contents of the member
+            size - int, size of the member in bytes
+        Returns:
+            bytes, contents of the member if smaller than `spill_size`, or else
+                String, path to its copy in the temporary directory
+        '''
+        if size <= self.spill_size:
+            return fp.read()
+        if self._temp_dir is None:
+            self._temp_dir = tempfile.mkdtemp(prefix='dfttopif')
+        path = os.path.join(self._temp_dir, str(len(os.listdir(self._temp_dir))))
+        with open(path, 'wb') as out:
+            shutil.copyfileobj(fp, out, 1 << 20)
+        return path
+
+    @staticmethod
+    def _open_stored(stored):
+        '''Open a copy of a member made by `_store` for reading bytes'''
+        return open(stored, 'rb') if isinstance(stored, str) else io.BytesIO(stored)
+
+    def close(self):
+        if self._temp_dir is not None:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
+
+
+class TarSource(ArchiveSource):
+    '''Files of a directory inside a tar archive, which are read without extracting them
+
+    Compressed archives cannot be seeked backwards without decompressing them again from
+    the start, so their members are read in a single forward pass: opening a member reads
+    it, and keeps any selected member before it that was not read yet (see
+    `ArchiveSource._store`). Members after the last one opened are never decompressed.
+    '''
+
+    def __init__(self, tar, root='', exclude=None):
+        '''Input:
+            tar - tarfile.TarFile, archive opened for reading
+            root - String, path of the directory inside the archive ("" for the top level)
+            exclude - list of String, glob patterns of the names of members to leave out.
+                Defaults to `archive_exclude`
+        '''
+        self.tar = tar
+        self.root = root
+        self._members = _select_members([(m.name, m) for m in tar.getmembers() if m.isfile()], root, exclude)
+        self._sequential = isinstance(tar.fileobj, _compressed_types)
+        self._contents = {}
+        self._pending = sorted(self._members.values(), key=lambda m: m.offset_data)
+
+    @staticmethod
+    def find_root(tar):
+        '''Find the directory of the calculation in an archive: the first top-level
+        directory, if any, or the top level of the archive otherwise
+
+        Input:
+            tar - tarfile.TarFile, archive opened for reading
+        Returns:
+            String, path of the directory inside the archive
+        '''
+        return _find_root([(m.name, m.isdir()) for m in tar.getmembers()])
+
+    def _open_member(self, member):
+        if not self._sequential:
+            return self.tar.extractfile(member)
+        # Read forward up to the member, keeping the members passed along the way
+        while member.offset_data not in self._contents:
+            m = self._pending.pop(0)
+            with self.tar.extractfile(m) as fp:
+                self._contents[m.offset_data] = self._store(fp, m.size)
+        return self._open_stored(self._contents[member.offset_data])
+
+
+class ZipSource(ArchiveSource):
+    '''Files of a directory inside a zip archive, which are read without extracting them
+
+    Zip archives compress each member separately, so any member is read directly.
+    '''
+
+    def __init__(self, zf, root='', exclude=None):
+        '''Input:
+            zf - zipfile.ZipFile, archive opened for reading
+            root - String, path of the directory inside the archive ("" for the top level)
+            exclude - list of String, glob patterns of the names of members to leave out.
+                Defaults to `archive_exclude`
+        '''
+        self.zf = zf
+        self.root = root
+        # Directories are the members whose name ends with a slash (ZipInfo.is_dir needs Python 3.6)
+        files = [(i.filename, i) for i in zf.infolist() if not i.filename.endswith('/')]
+        self._members = _select_members(files, root, exclude)
+
+    @staticmethod
+    def find_root(zf):
+        '''Find the directory of the calculation in a zip archive (see `TarSource.find_root`)'''
+        return _find_root([(i.filename, i.filename.endswith('/')) for i in zf.infolist()])
+
+    def _open_member(self, member):
+        return self.zf.open(member)
+
+
+class StreamTarSource(ArchiveSource):
+    '''Files of a directory inside a tar archive that is read sequentially, such as a
+    compressed one
+
+    The archive is read once, when the source is created. The members that may belong to
+    the calculation, and are not excluded, are stored: in memory if they are smaller than
+    `spill_size`, or else in a temporary directory, which is deleted by close(). The other
+    members are skipped without being stored.
+    '''
+
+    def __init__(self, fileobj, exclude=None, spill_size=None):
+        '''Input:
+            fileobj - binary file object, stream of the archive, either decompressed or
+                compressed with gzip, bzip2 or xz
+            exclude - list of String, glob patterns of the names of members to leave out.
+                Defaults to `archive_exclude`
+            spill_size - int, size in bytes above which members are written to disk.
+                Defaults to `spill_size`
+        '''
+        if exclude is None:
+            exclude = archive_exclude
+        if spill_size is not None:
+            self.spill_size = spill_size
+        entries = []
+        contents = {}
+        try:
+            with tarfile.open(fileobj=fileobj, mode='r|*') as tar:
+                for member in tar:
+                    entries.append((member.name, member.isdir()))
+                    name = _member_name(member.name)
+                    # The calculation is either at the top level, or in a top-level directory
+                    if not member.isfile() or name.count('/') > 1 or _is_excluded(name.split('/')[-1], exclude):
+                        continue
+                    with tar.extractfile(member) as fp:
+                        contents[name] = self._store(fp, member.size)
+        except Exception:
+            self.close()
+            raise
+        self.root = _find_root(entries)
+        self._members = _select_members(list(contents.items()), self.root, exclude)
+
+    def _open_member(self, member):
+        return self._open_stored(member)
+
+    def indexed(self, name):
+        member = self.member(name) if self.isfile(name) else None
+        if isinstance(member, str) and not is_compressed(name):
+            # Map the copy on disk, rather than reading it into memory
+            return IndexedFile(member)
+        return super(StreamTarSource, self).indexed(name)
+
+
+def _is_excluded(name, exclude):
+    '''Whether the name of a file matches any of a list of glob patterns'''
+    return any([fnmatch.fnmatch(name, p) for p in exclude])
+
+
+def _select_members(members, root, exclude=None):
+    '''Select the members of an archive that are files of a directory
+
+    Input:
+        members - list of (String, object), names and members of the regular files of the archive
+        root - String, path of the directory inside the archive
+        exclude - list of String, glob patterns of the names of members to leave out.
+            Defaults to `archive_exclude`
+    Returns:
+        dict, members by their name within the directory
+    '''
+    if exclude is None:
+        exclude = archive_exclude
+    selected = {}
+    prefix = root.rstrip('/') + '/' if root else ''
+    for name, member in members:
+        name = _member_name(name)
+        if name.startswith(prefix) and '/' not in name[len(prefix):]:
+            name = name[len(prefix):]
+            if not _is_excluded(name, exclude):
+                selected[name] = member
+    return selected
+
+
+def _find_root(entries):
+    '''Find the directory of the calculation in an archive (see `TarSource.find_root`)
+
+    Input:
+        entries - list of (String, bool), names of the members of the archive, in order,
+            and whether they are directories
+    '''
+    for name, isdir in entries:
+        name = _member_name(name)
+        if '/' in name or (isdir and name):
+            return name.split('/')[0]
+    return ''
+
+
+def _member_name(name):
+    '''Normalize the name of an archive member (e.g., "./dir/OUTCAR" -> "dir/OUTCAR")'''
+    while name.startswith('./'):
+        name = name[2:]
+    return name.rstrip('/')
+
+
+def as_source(directory):
+    '''Get the FileSource of a directory
+
+    Input:
+        directory - String, path to a directory on disk, FileSource, or DirectoryListing
+    Returns:
+        FileSource
+    '''
+    if isinstance(directory, DirectoryListing):
+        return directory.source
+    return directory if isinstance(directory, FileSource) else DirectorySource(directory)
+
+
+class DirectoryListing(object):
+    '''Files of a directory, listed once, with the start of each file read on demand
+
+    Signature rules of all parsers are checked against the same listing, so that
+    each file is read at most once during detection.
+    '''
+
+    def __init__(self, directory, files=None):
+        '''Initialize the listing
+
+        Input:
+            directory - String, path to the directory, or FileSource
+            files - list of String, names of the regular files in the directory,
+                if already known. Otherwise, the directory is listed
+        '''
+        self.source = as_source(directory)
+        self.directory = self.source.root
+        if files is None:
+            files = self.source.list_files()
+        self.files = sorted(files)
+        self._names = set([strip_compression(f) for f in self.files])
+        self._headers = {}
+
+    def has_file(self, name):
+        '''Whether the directory holds a file, possibly compressed'''
+        return name in self._names
+
+    def header(self, f):
+        '''Get the start of a file, in lower case'''
+        if f not in self._headers:
+            self._headers[f] = self.source.read_header(f).lower()
+        return self._headers[f]
+
+    def has_header(self, text):
+        '''Whether the start of any file, other than bulk data files, contains a string (case insensitive)'''
+        text = text.lower()
+        return any(text in self.header(f) for f in self.files if not is_bulk_file(f))
+
+
 class DFTParser(object):
     '''Base class for all tools to parse a directory of output files from a DFT Calculation
     
@@ -22,6 +827,14 @@ class DFTParser(object):
     To get a list of the names of results available via a particular instance, call get_result_functions(). These
      methods return a pypif Property object.
 
+    The result of each of these methods is computed on the first call and then cached on the instance, including when
+     they are called by other methods of the parser. The cached objects are shared between calls, so copy them before
+     modifying them.
+
+    Parsers only read the files in their directory through paths built from it, and never change process-wide state
+     such as the working directory. Separate parser instances can therefore be used concurrently from different
+     threads, e.g. to convert several directories at once with a ThreadPoolExecutor.
+
     Developer Notes
     ---------------
     
@@ -38,22 +851,91 @@ class DFTParser(object):
     
     _directory = None
     '''Path to directory containing calculation files'''
+
+    _source = None
+    '''FileSource through which the calculation files are read'''
+
+    _listing = None
+    '''DirectoryListing of the calculation files, with the start of the files already read'''
     
     _converged = None
     ''' Whether this calculation has converged '''
+
+    _structure = None
+    ''' Output structure (ase.Atoms, with the results of the calculation attached) '''
+
+    signature_files = ()
+    ''' Names of files (possibly compressed) that are all found in a directory from this code '''
+
+    signature_headers = ()
+    ''' Strings (case insensitive) that are each found at the start of a file in a directory from this code '''
+
+    priority = 0
+    ''' Rank of this parser when several parsers match the same directory, highest first '''
+
+    input_files = ()
+    ''' Names of the files (possibly compressed) that this parser reads, when they are present '''
+
+    parser_version = None
+    ''' Version of this parser, part of the key of cached pifs (see dfttopif.cache). Defaults to the
+    __version__ of the package that defines the parser '''
+
+    _cache = None
+    ''' Results of the getters in get_setting_functions and get_result_functions, by function name '''
+
+    cache_hits = None
+    ''' Counter of the calls to each getter answered from the cache '''
+
+    cache_misses = None
+    ''' Counter of the calls to each getter that computed the result '''
     
     def __init__(self, directory):
         '''Initialize a parser.
         
         Input:
-            directory - String, path to a directory of output files
+            directory - String, path to a directory of output files,
+                or FileSource giving access to the files (e.g., in an archive),
+                or DirectoryListing used to detect the parser, whose headers are reused
         '''
-        
+        self._source = as_source(directory)
+        if isinstance(directory, DirectoryListing):
+            self._listing = directory
+
         # Sanity check: Make sure the format is correct
-        if not self.test_if_from(directory):
+        if not self.test_if_from(self._source):
             raise Exception('Files in directory inconsistent with this format')
             
-        self._directory = directory
+        self._directory = self._source.root
+        self._memoize_getters()
+
+    def _memoize_getters(self):
+        '''Cache the results of the getters listed in get_setting_functions() and
+        get_result_functions(), so that each is computed at most once per parser
+
+        The counts of cached and computed calls to each getter are stored in
+        `cache_hits` and `cache_misses`. Call clear_cache() to discard the results.
+        Getters that the parser does not define are skipped.
+        '''
+        self._cache = {}
+        self.cache_hits = Counter()
+        self.cache_misses = Counter()
+        names = set(self.get_setting_functions().values()) | set(self.get_result_functions().values())
+        for name in names:
+            func = getattr(self, name, None)
+            if func is not None:
+                setattr(self, name, self._memoized(name, func))
+
+    def _memoized(self, name, func):
+        '''Wrap a getter, caching its result under its name'''
+        @functools.wraps(func)
+        def wrapper():
+            if name in self._cache:
+                self.cache_hits[name] += 1
+            else:
+                self.cache_misses[name] += 1
+                self._cache[name] = func()
+            return self._cache[name]
+        return wrapper
       
     @classmethod
     def test_if_from(self, directory):
@@ -61,13 +943,34 @@ class DFTParser(object):
         seems like it is from this DFT code.
         
         Input:
-            directory - String, path to a directory of output files
+            directory - String, path to a directory of output files, or FileSource
         Returns: 
             boolean, whether directory was created by this code
         '''
         
         raise NotImplementedError
         
+    def _get_listing(self):
+        '''Get the DirectoryListing of the calculation files, which is created on first use
+
+        Returns:
+            DirectoryListing, the one the parser was created from, if any
+        '''
+        if self._listing is None:
+            self._listing = DirectoryListing(self._source)
+        return self._listing
+
+    @classmethod
+    def list_input_files(cls, listing):
+        '''List the files of a directory that this parser reads, without parsing them
+
+        Input:
+            listing - DirectoryListing, files of the directory
+        Returns:
+            list of String, names of the files
+        '''
+        return [f for f in listing.files if strip_compression(f) in cls.input_files]
+
     def get_setting_functions(self):
         '''Get a dictionary containing the names of methods
         that return settings of the calculation
@@ -112,28 +1015,6 @@ class DFTParser(object):
             'Stresses': 'get_stresses'
         }
         
-    def _call_ase(self, func):
-        '''Make a call to an ASE function.
-        
-        Handles changing directories
-        
-        Returns: Result of ASE function
-        '''
-        # Change directories
-        old_path = os.getcwd()
-        os.chdir(self._directory)
-        
-        # Call function
-        try:
-            res = func()
-        except:
-            os.chdir(old_path)
-            raise
-        
-        # Change back
-        os.chdir(old_path)
-        return res
-        
     def get_name(self):
         '''Get the name of this program'''
         raise NotImplementedError
@@ -147,13 +1028,45 @@ class DFTParser(object):
         '''
         raise NotImplementedError
     
+    def close(self):
+        '''Release the files that the parser keeps open, such as memory maps of its outputs
+
+        The parser cannot be used afterwards.
+        '''
+        pass
+
+    def clear_cache(self):
+        '''Discard any data cached from the output files
+
+        Call this if the files in the directory change after the parser was created.
+        '''
+        self._converged = None
+        self._structure = None
+        self._listing = None
+        if self._cache is not None:
+            self._cache.clear()
+
     def get_output_structure(self):
         '''Get the output structure, if available
+
+        The structure is only read from the output files on the first call.
+        Treat the returned object as read-only, as it is shared between calls.
         
         Returns:
             ase.Atoms - Output structure from this calculation
                 or None if output file not found
         '''
+        if self._structure is None:
+            self._structure = self._read_output_structure()
+        return self._structure
+
+    def _read_output_structure(self):
+        '''Read the output structure from the output files
+
+        Hidden operation: self.get_output_structure() is the public
+        interface, which may draw from a cached result
+
+        Returns: ase.Atoms'''
         raise NotImplementedError
     
     def get_composition(self):
@@ -288,6 +1201,22 @@ class DFTParser(object):
 
         raise NotImplementedError
 
+    @staticmethod
+    def _get_bandgap_from_dos(energy, dos, efermi):
+        """Compute the distance between the last occupied state below and the first state
+        above the Fermi energy, treating gaps narrower than two grid points as zero"""
+        has_states = dos > 1e-3
+        below = energy[has_states & (energy < efermi)]
+        above = energy[has_states & (energy > efermi)]
+        if len(below) == 0 or len(above) == 0:
+            raise Exception('Algorithm failed to find the band gap')
+        bot = below[-1]
+        top = above[0]
+        step_size = energy[1] - energy[0]
+        if top - bot < step_size*2:
+            return 0.0
+        return float(top - bot)
+
     def get_pressure(self):
         '''Get the pressure acting on the system
 
@@ -1,23 +1,84 @@
 from pypif.obj.common import Property, Scalar
 
-from .base import DFTParser, Value_if_true
+from .base import DFTParser, DirectoryListing, Value_if_true, as_source, is_bulk_file
 import os
 from pypif.obj.common.value import Value
 from dftparse.pwscf.stdout_parser import PwscfStdOutputParser
 from ase import Atoms
+import numpy as np
 
 class PwscfParser(DFTParser):
     '''
     Parser for PWSCF calculations
     '''
 
-    def __init__(self, directory):
+    _output_keys = ['Geometry Optimization', ['End of', 'Geometry Optimization'], 'convergence has been achieved',
+                    'number of atoms/cell', 'number of atomic types', 'with spin-orbit', 'the Fermi energy is',
+                    'PseudoPot. #', 'LDA+U calculation', 'lattice parameter (alat)', 'crystal axes:',
+                    ['site n.', 'atom', 'positions', 'alat units'], 'Begin final coordinates']
+    '''Search strings looked up in the output file, whose first and last matching lines are indexed'''
+
+    signature_headers = ('Program PWSCF', '&control')
+
+    _detected = None
+    '''Directory, and the input and output files found in it by test_if_from'''
+
+    _line_index = None
+    '''Offsets of the first and last line of the output matching each of `_output_keys`'''
+
+    _output = None
+    '''Indexed output file, read when the parser is created'''
+
+    _dos = None
+    '''Result of `_read_dos`, in a list so that the absence of a DOS file is cached too'''
+
+    _history_keys = ['total energy', 'total force', 'pressure', 'stress', 'forces']
+    '''Settings that are reported at each step of a calculation, and whose history can be kept'''
+
+    history = None
+    '''Values of `_history_keys` at each step, as NumPy arrays (only if keep_history is True)'''
+
+    def __init__(self, directory, keep_history=False):
+        '''Initialize the parser, reading through the output once
+
+        Input:
+            directory - String, path to the directory containing the calculation
+            keep_history - bool, whether to store the value of per-step settings (e.g.,
+                energies, forces, stress) at each step in `history`. Otherwise, only the
+                last value of each setting is kept
+        '''
         super(PwscfParser, self).__init__(directory)
+        self._keep_history = keep_history
+        self._read_output()
+
+    def _read_output(self):
+        '''Read through the output once, parsing the settings and indexing the lines of `_output_keys`'''
         self.settings = {}
+        history = dict((k, []) for k in self._history_keys) if self._keep_history else None
+        # Stream the output through the dftparse parser, indexing it along the way
         parser = PwscfStdOutputParser()
-        with open(os.path.join(directory, self.outputf), "r") as f:
-            for line in parser.parse(f.readlines()):
-                self.settings.update(line)
+        for block in parser.parse(self._index_output()):
+            self.settings.update(block)
+            if history is not None:
+                for key in self._history_keys:
+                    if key in block:
+                        history[key].append(block[key])
+        if history is not None:
+            self.history = dict((k, np.array(v, dtype=float)) for k, v in history.items())
+
+    def close(self):
+        if self._output is not None:
+            self._output.close()
+        self._output = None
+
+    def clear_cache(self):
+        super(PwscfParser, self).clear_cache()
+        # Find the input and output files again, and read the output again
+        self.close()
+        self._detected = None
+        self._dos = None
+        self.test_if_from(self._source)
+        self._read_output()
 
     def get_result_functions(self):
         base_results = super(PwscfParser, self).get_result_functions()
@@ -34,42 +95,116 @@ class PwscfParser(DFTParser):
             return None
         return Property(scalars=[Scalar(value=self.settings[key])], units=self.settings["{} units".format(key)])
 
-    def _get_line(self, search_string, search_file, basedir=None, return_string=True, case_sens=True):
+    def _index_output(self):
+        '''Scan the output file once, recording the offsets of the first and last
+        line that contains each of the search strings in `_output_keys`
+
+        Returns:
+            Generator over the lines of the output, which performs the scan as it is consumed
+        '''
+        self._output = self._source.indexed(self.outputf)
+        keys = [tuple([k]) if isinstance(k, str) else tuple(k) for k in self._output_keys]
+        self._line_index = dict((k, None) for k in keys)
+        for offset, line in self._output.lines_with_offsets():
+            for key in keys:
+                if all([i in line for i in key]):
+                    found = self._line_index[key]
+                    self._line_index[key] = (offset, offset) if found is None else (found[0], offset)
+            yield line
+
+    def _get_line(self, search_string, search_file, basedir=None, return_string=True, case_sens=True, last=False):
         '''Return the first line containing a set of strings in a file.
 
         If return_string is False, we just return whether such a line
         was found. If case_sens is False, the search is case
-        insensitive.
+        insensitive. If last is True, the file is read backwards from
+        the end and the last such line is returned.
 
         '''
-        if basedir == None: basedir = self._directory # default
-        if os.path.isfile(os.path.join(basedir, search_file)):
+        source = self._source if basedir is None else as_source(basedir)
+        # look up strings of the output file in the index
+        key = (search_string,) if type(search_string) == type('') else tuple(search_string)
+        if self._line_index is not None and key in self._line_index and case_sens \
+                and source is self._source and search_file == self.outputf:
+            found = self._line_index[key]
+            if found is not None:
+                return self._output.line(found[1] if last else found[0]) if return_string else True
+            if return_string:
+                raise Exception('%s not found in %s'%(' & '.join(key),source.path(search_file)))
+            return False
+        if source.isfile(search_file):
             # if single search string
             if type(search_string) == type(''): search_string = [search_string]
             # if case insensitive, convert everything to lowercase
             if not case_sens: search_string = [i.lower() for i in search_string]
-            with open(os.path.join(basedir, search_file)) as fp:
-                # search for the strings line by line
+            # the output file is already indexed, and so decompressed, by the parser
+            indexed = self._output if source is self._source and search_file == self.outputf else None
+            other = None
+            if last:
+                if indexed is None:
+                    indexed = other = source.indexed(search_file)
+                fp = indexed.reverse_lines()
+            elif indexed is not None:
+                fp = indexed.open('r', source.path(search_file))
+            else:
+                fp = source.open_file(search_file)
+            # search for the strings line by line
+            try:
                 for line in fp:
                     query_line = line if case_sens else line.lower()
                     if all([i in query_line for i in search_string]):
                         return line if return_string else True
-                if return_string:
-                    raise Exception('%s not found in %s'%(' & '.join(search_string),os.path.join(basedir, search_file)))
-                else: return False
-        else: raise Exception('%s file does not exist'%os.path.join(basedir, search_file))
+            finally:
+                if not last: fp.close()
+                if other is not None: other.close()
+            if return_string:
+                raise Exception('%s not found in %s'%(' & '.join(search_string),source.path(search_file)))
+            else: return False
+        else: raise Exception('%s file does not exist'%source.path(search_file))
     
     def test_if_from(self, directory):
-        '''Look for PWSCF input and output files'''
-        self.inputf = self.outputf = ''
-        files = [f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f))]
-        for f in files:
-            if self._get_line('Program PWSCF', f, basedir=directory, return_string=False):
-                self.outputf = f
-            elif self._get_line('&control', f, basedir=directory, return_string=False, case_sens=False):
-                self.inputf = f
-            if self.inputf and self.outputf: return True
-        return False
+        '''Look for PWSCF input and output files, based on the start of each file'''
+        source = as_source(directory)
+        if self._detected is None or self._detected[0] != source.root:
+            # Reuse the start of the files read when the parser was detected, if any
+            listing = self._get_listing() if source is self._source else DirectoryListing(source)
+            inputf = outputf = ''
+            for f in self._list_files(listing):
+                header = listing.header(f)
+                if 'program pwscf' in header:
+                    outputf = f
+                elif '&control' in header:
+                    inputf = f
+                if inputf and outputf: break
+            # Cache the result, so that detection only runs once per directory
+            self._detected = (source.root, inputf, outputf)
+        self.inputf, self.outputf = self._detected[1:]
+        return bool(self.inputf and self.outputf)
+
+    @classmethod
+    def list_input_files(cls, listing):
+        '''List the input, output and DOS files of a directory, based on the start of each file'''
+        files = []
+        for f in listing.files:
+            if is_bulk_file(f):
+                continue
+            header = listing.header(f)
+            first_line = header.split('\n', 1)[0]
+            if 'program pwscf' in header or '&control' in header or \
+                    ('e (ev)' in first_line and 'int dos(e)' in first_line):
+                files.append(f)
+        return files
+
+    @staticmethod
+    def _list_files(listing):
+        '''List the regular files of a directory, leaving out bulk data files such as wavefunctions
+
+        Input:
+            listing - DirectoryListing, files of the directory
+        Returns:
+            list of String, names of the files
+        '''
+        return [f for f in listing.files if not is_bulk_file(f)]
 
     def get_version_number(self):
         '''Determine the version number from the output'''
@@ -100,16 +235,17 @@ class PwscfParser(DFTParser):
         we look for ionic (electronic) convergence in the output'''
         if self.is_relaxed():
             # relaxation run case
-            return self._get_line(['End of', 'Geometry Optimization'], self.outputf, return_string=False)
+            return self._get_line(['End of', 'Geometry Optimization'], self.outputf, return_string=False, last=True)
         else:
             # static run case
-            return self._get_line('convergence has been achieved', self.outputf, return_string=False)
+            return self._get_line('convergence has been achieved', self.outputf, return_string=False, last=True)
 
     def get_KPPRA(self):
         '''Determine the no. of k-points in the BZ (from the input) times the
         no. of atoms (from the output)'''
         # Find the no. of k-points
-        fp = open(os.path.join(self._directory, self.inputf)).readlines()
+        with self._source.open_file(self.inputf) as f:
+            fp = f.readlines()
         for l,ll in enumerate(fp):
             if "K_POINTS" in ll:
                 # determine the type of input
@@ -145,7 +281,7 @@ class PwscfParser(DFTParser):
                 natoms = int(self._get_line('number of atoms/cell', self.outputf).split()[4])
                 return Value(scalars=[Scalar(value=nk*natoms)])
         fp.close()
-        raise Exception('%s not found in %s'%('KPOINTS',os.path.join(self._directory, self.inputf)))
+        raise Exception('%s not found in %s'%('KPOINTS',self._source.path(self.inputf)))
 
     @Value_if_true
     def uses_SOC(self):
@@ -157,36 +293,39 @@ class PwscfParser(DFTParser):
         ppnames = []
         # Find the number of atom types
         natomtypes = int(self._get_line('number of atomic types', self.outputf).split()[5])
-        # Find the pseudopotential names
-        with open(os.path.join(self._directory, self.outputf)) as fp:
+        # Find the pseudopotential names, starting from the first one
+        found = self._line_index[('PseudoPot. #',)]
+        if found is not None:
+            fp = self._output.lines(found[0])
             for line in fp:
                 if "PseudoPot. #" in line:
                     ppnames.append(Scalar(value=next(fp).split('/')[-1].rstrip()))
                     if len(ppnames) == natomtypes:
                         return Value(scalars=ppnames)
-            raise Exception('Could not find %i pseudopotential names'%natomtypes)
+        raise Exception('Could not find %i pseudopotential names'%natomtypes)
 
     def get_U_settings(self):
         '''Determine the DFT+U type and parameters from the output'''
-        with open(os.path.join(self._directory, self.outputf)) as fp:
-            for line in fp:
-                if "LDA+U calculation" in line:
-                    U_param = {}
-                    U_param['Type'] = line.split()[0]
-                    U_param['Values'] = {}
-                    # look through next several lines
-                    for nl in range(15):
-                        line2 = next(fp).split()
-                        if len(line2) > 1 and line2[0] == "atomic":
-                            pass # column titles
-                        elif len(line2) == 6:
-                            U_param['Values'][line2[0]] = {}
-                            U_param['Values'][line2[0]]['L'] = float(line2[1])
-                            U_param['Values'][line2[0]]['U'] = float(line2[2])
-                            U_param['Values'][line2[0]]['J'] = float(line2[4])
-                        else: break # end of data block
-                    return Value(**U_param)
+        found = self._line_index[('LDA+U calculation',)]
+        if found is None:
             return None
+        fp = self._output.lines(found[0])
+        line = next(fp)
+        U_param = {}
+        U_param['Type'] = line.split()[0]
+        U_param['Values'] = {}
+        # look through next several lines
+        for nl in range(15):
+            line2 = next(fp).split()
+            if len(line2) > 1 and line2[0] == "atomic":
+                pass # column titles
+            elif len(line2) == 6:
+                U_param['Values'][line2[0]] = {}
+                U_param['Values'][line2[0]]['L'] = float(line2[1])
+                U_param['Values'][line2[0]]['U'] = float(line2[2])
+                U_param['Values'][line2[0]]['J'] = float(line2[4])
+            else: break # end of data block
+        return Value(**U_param)
 
     def get_vdW_settings(self):
         '''Determine the vdW type if using vdW xc functional or correction
@@ -218,8 +357,9 @@ class PwscfParser(DFTParser):
         wrapped = [[Scalar(value=x) for x in y] for y in self.settings["stress"]]
         return Property(matrices=[wrapped], units=self.settings["stress units"])
 
-    def get_output_structure(self):
-        '''Determine the structure from the output'''
+    def _read_output_structure(self):
+        '''Determine the structure from the output, starting from the lines
+        located while the output was indexed'''
         bohr_to_angstrom = 0.529177249
 
         # determine the number of atoms
@@ -229,105 +369,124 @@ class PwscfParser(DFTParser):
         alat = float(self._get_line('lattice parameter (alat)', self.outputf).split('=')[-1].split()[0])
 
         # find the initial unit cell
+        found = self._line_index[('crystal axes:',)]
+        if found is None: raise Exception('Cannot find the initial unit cell')
+        fp = self._output.lines(found[0])
+        next(fp)
         unit_cell = []
-        with open(os.path.join(self._directory, self.outputf), 'r') as fp:
-            for line in fp:
-                if "crystal axes:" in line:
-                    for i in range(3):
-                        unit_cell.append([float(j)*alat*bohr_to_angstrom for j in next(fp).split('(')[-1].split(')')[0].split()])
-                    break
-            if len(unit_cell) == 0: raise Exception('Cannot find the initial unit cell')
+        for i in range(3):
+            unit_cell.append([float(j)*alat*bohr_to_angstrom for j in next(fp).split('(')[-1].split(')')[0].split()])
 
         # find the initial atomic coordinates
+        found = self._line_index[('site n.', 'atom', 'positions', 'alat units')]
+        if found is None: raise Exception('Cannot find the initial atomic coordinates')
+        fp = self._output.lines(found[0])
+        next(fp)
         coords = [] ; atom_symbols = []
-        with open(os.path.join(self._directory, self.outputf), 'r') as fp:
-            for line in fp:
-                if "site n." in line and "atom" in line and "positions" in line and "alat units" in line:
-                    for i in range(natoms):
-                        coordline = next(fp)
-                        atom_symbols.append(''.join([i for i in coordline.split()[1] if not i.isdigit()]))
-                        coord_conv_factor = alat*bohr_to_angstrom
-                        coords.append([float(j)*coord_conv_factor for j in coordline.rstrip().split('=')[-1].split('(')[-1].split(')')[0].split()])
-                    break
-            if len(coords) == 0: raise Exception('Cannot find the initial atomic coordinates')
-
+        for i in range(natoms):
+            coordline = next(fp)
+            atom_symbols.append(''.join([i for i in coordline.split()[1] if not i.isdigit()]))
+            coord_conv_factor = alat*bohr_to_angstrom
+            coords.append([float(j)*coord_conv_factor for j in coordline.rstrip().split('=')[-1].split('(')[-1].split(')')[0].split()])
+
+        # the final structure of a relaxation run is in the last block of final coordinates
+        found = self._line_index[('Begin final coordinates',)]
         if type(self.is_relaxed()) == type(None):
             # static run: create, populate, and return the initial structure
             structure = Atoms(symbols=atom_symbols, cell=unit_cell, pbc=True)
             structure.set_positions(coords)
             return structure
+        elif found is None:
+            raise Exception('Cannot find the final coordinates')
         else:
             # relaxation run: update with the final structure
-            with open(os.path.join(self._directory, self.outputf)) as fp:
-                for line in fp:
-                    if "Begin final coordinates" in line:
-                        if 'new unit-cell volume' in next(fp):
-                            # unit cell allowed to change
-                            next(fp) # blank line
-                            # get the final unit cell
-                            unit_cell = []
-                            cellheader = next(fp)
-                            if 'bohr' in cellheader.lower():
-                                cell_conv_factor = bohr_to_angstrom
-                            elif 'angstrom' in cellheader.lower():
-                                cell_conv_factor = 1.0
-                            else:
-                                alat = float(cellheader.split('alat=')[-1].replace(')', ''))
-                                cell_conv_factor = alat*bohr_to_angstrom
-                            for i in range(3):
-                                unit_cell.append([float(j)*cell_conv_factor for j in next(fp).split()])
-                            next(fp) # blank line
-
-                        # get the final atomic coordinates
-                        coordtype = next(fp).split()[-1].replace('(', '').replace(')', '')
-                        if coordtype == 'bohr':
-                            coord_conv_factor = bohr_to_angstrom
-                        elif coordtype == 'angstrom' or coordtype == 'crystal':
-                            coord_conv_factor = 1.0
-                        else:
-                            coord_conv_factor = alat*bohr_to_angstrom
-                        coords = [] # reinitialize the coords
-                        for i in range(natoms):
-                            coordline = next(fp).split()
-                            coords.append([float(j)*coord_conv_factor for j in coordline[1:4]])
-
-                        # create, populate, and return the final structure
-                        structure = Atoms(symbols=atom_symbols, cell=unit_cell, pbc=True)
-                        if coordtype == 'crystal':
-                            structure.set_scaled_positions(coords) # direct coord
-                        else:
-                            structure.set_positions(coords) # cartesian coord
-                        return structure
-                raise Exception('Cannot find the final coordinates')
+            fp = self._output.lines(found[1])
+            next(fp) # Begin final coordinates
+            if 'new unit-cell volume' in next(fp):
+                # unit cell allowed to change
+                next(fp) # blank line
+                # get the final unit cell
+                unit_cell = []
+                cellheader = next(fp)
+                if 'bohr' in cellheader.lower():
+                    cell_conv_factor = bohr_to_angstrom
+                elif 'angstrom' in cellheader.lower():
+                    cell_conv_factor = 1.0
+                else:
+                    alat = float(cellheader.split('alat=')[-1].replace(')', ''))
+                    cell_conv_factor = alat*bohr_to_angstrom
+                for i in range(3):
+                    unit_cell.append([float(j)*cell_conv_factor for j in next(fp).split()])
+                next(fp) # blank line
+
+            # get the final atomic coordinates
+            coordtype = next(fp).split()[-1].replace('(', '').replace(')', '')
+            if coordtype == 'bohr':
+                coord_conv_factor = bohr_to_angstrom
+            elif coordtype == 'angstrom' or coordtype == 'crystal':
+                coord_conv_factor = 1.0
+            else:
+                coord_conv_factor = alat*bohr_to_angstrom
+            coords = [] # reinitialize the coords
+            for i in range(natoms):
+                coordline = next(fp).split()
+                coords.append([float(j)*coord_conv_factor for j in coordline[1:4]])
 
-    def get_dos(self):
-        '''Find the total DOS shifted by the Fermi energy'''
-        # find the dos file
-        fildos = ''
-        files = [f for f in os.listdir(self._directory) if os.path.isfile(os.path.join(self._directory, f))]
-        for f in files:
-            fp = open(os.path.join(self._directory, f), 'r')
-            first_line = next(fp)
-            if "E (eV)" in first_line and "Int dos(E)" in first_line:
-                fildos = f
-                ndoscol = len(next(fp).split())-2 # number of spin channels
-                fp.close()
-                break
-            fp.close()
-        if not fildos: return None # cannot find DOS
+            # create, populate, and return the final structure
+            structure = Atoms(symbols=atom_symbols, cell=unit_cell, pbc=True)
+            if coordtype == 'crystal':
+                structure.set_scaled_positions(coords) # direct coord
+            else:
+                structure.set_positions(coords) # cartesian coord
+            return structure
+
+    def _find_dos_file(self):
+        '''Find the file with the total DOS written by dos.x, based on its header
+
+        Returns:
+            String, name of the DOS file, or None if there is none
+        '''
+        listing = self._get_listing()
+        for f in self._list_files(listing):
+            first_line = listing.header(f).split('\n', 1)[0]
+            if "e (ev)" in first_line and "int dos(e)" in first_line:
+                return f
+        return None
+
+    def _read_dos(self):
+        '''Read the total DOS, with the energy shifted by the Fermi energy. The DOS file
+        is only read once, for both get_dos and get_band_gap
+
+        Returns:
+            energy - 1D array, energies in eV
+            dos - 1D array, total DOS summed over spin channels
+            or None if the DOS file cannot be found
+        '''
+        if self._dos is None:
+            self._dos = [self._load_dos()]
+        return self._dos[0]
+
+    def _load_dos(self):
+        '''Read the total DOS from the DOS file (see `_read_dos`)'''
+        fildos = self._find_dos_file()
+        if fildos is None: return None # cannot find DOS
 
         # get the Fermi energy
         line = self._get_line('the Fermi energy is', self.outputf)
         efermi = float(line.split('is')[-1].split()[0])
 
-        # grab the DOS
-        energy = [] ; dos = []
-        fp = open(os.path.join(self._directory, fildos), 'r')
-        next(fp) # comment line
-        for line in fp:
-            ls = line.split()
-            energy.append(Scalar(value=float(ls[0])-efermi))
-            dos.append(Scalar(value=sum([float(i) for i in ls[1:1+ndoscol]])))
+        # grab the DOS: the columns are the energy, the DOS of each spin channel and the integrated DOS
+        with self._source.open_file(fildos) as fp:
+            data = np.loadtxt(fp, skiprows=1, ndmin=2)
+        ndoscol = data.shape[1] - 2 # number of spin channels
+        return data[:, 0] - efermi, data[:, 1:1+ndoscol].sum(axis=1)
+
+    def get_dos(self):
+        '''Find the total DOS shifted by the Fermi energy'''
+        dosdata = self._read_dos()
+        if dosdata is None: return None # cannot find DOS
+        energy = [Scalar(value=e) for e in dosdata[0].tolist()]
+        dos = [Scalar(value=d) for d in dosdata[1].tolist()]
         return Property(scalars=dos, units='number of states per unit cell', conditions=Value(name='energy', scalars=energy, units='eV'))
 
     def get_forces(self):
@@ -352,32 +511,14 @@ class PwscfParser(DFTParser):
 
     def get_band_gap(self):
         '''Compute the band gap from the DOS'''
-        dosdata = self.get_dos()
-        if type(dosdata) == type(None):
+        dosdata = self._read_dos()
+        if dosdata is None:
             return None # cannot find DOS
-        else:
-            energy = dosdata.conditions.scalars
-            dos = dosdata.scalars
-            step_size = energy[1].value - energy[0].value
-            not_found = True ; l = 0 ; bot = 10**3 ; top = -10**3
-            while not_found and l < len(dos):
-                # iterate through the data
-                e = float(energy[l].value)
-                dens = float(dos[l].value)
-                # note: dos already shifted by efermi
-                if e < 0 and dens > 1e-3:
-                    bot = e
-                elif e > 0 and dens > 1e-3:
-                    top = e
-                    not_found = False
-                l += 1
-            if top < bot:
-                raise Exception('Algorithm failed to find the band gap')
-            elif top - bot < step_size*2:
-                return Property(scalars=[Scalar(value=0)], units='eV')
-            else:
-                bandgap = float(top-bot)
-                return Property(scalars=[Scalar(value=round(bandgap,3))], units='eV')
+        # note: dos already shifted by efermi
+        bandgap = self._get_bandgap_from_dos(dosdata[0], dosdata[1], 0.0)
+        if bandgap == 0:
+            return Property(scalars=[Scalar(value=0)], units='eV')
+        return Property(scalars=[Scalar(value=round(bandgap,3))], units='eV')
 
     def get_one_electron_energy_contribution(self):
         return self._get_key_with_units("one-electron energy contribution")
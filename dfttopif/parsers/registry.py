@@ -0,0 +1,146 @@
+'''Registry of the available parsers, used to detect which code produced a directory
+
+Parsers are matched against a directory using the signature rules they declare
+(see DFTParser.signature_files and DFTParser.signature_headers), which only require
+listing the directory and reading the start of a few files. No parser is constructed
+during detection.
+
+Parsers from other packages join the registry through register_parser(), or by
+declaring an entry point in the "dfttopif.parsers" group of their setup.py:
+
+    entry_points={
+        'dfttopif.parsers': ['abinit = mypackage.abinit:AbinitParser']
+    }
+'''
+
+import os
+import threading
+import warnings
+
+from .base import DirectoryListing
+
+ENTRY_POINT_GROUP = 'dfttopif.parsers'
+'''Entry point group of the parsers provided by other packages'''
+
+_registry = []
+'''Registered parser classes, in order of registration'''
+
+_entry_points_loaded = False
+_lock = threading.Lock()
+
+
+def register_parser(parser_class):
+    '''Add a parser to the registry. Can also be used as a class decorator
+
+    Input:
+        parser_class - subclass of DFTParser
+    Returns:
+        parser_class
+    '''
+    with _lock:
+        if parser_class not in _registry:
+            _registry.append(parser_class)
+    return parser_class
+
+
+def _iter_entry_points():
+    '''List the entry points in ENTRY_POINT_GROUP of the installed packages'''
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:
+        try:
+            import pkg_resources
+        except ImportError:
+            return []
+        return list(pkg_resources.iter_entry_points(ENTRY_POINT_GROUP))
+    eps = entry_points()
+    if hasattr(eps, 'select'):
+        return list(eps.select(group=ENTRY_POINT_GROUP))
+    return list(eps.get(ENTRY_POINT_GROUP, []))
+
+
+def _load_entry_points():
+    '''Register the parsers declared as entry points, the first time this is called'''
+    global _entry_points_loaded
+    with _lock:
+        if _entry_points_loaded:
+            return
+        eps = _iter_entry_points()
+        _entry_points_loaded = True
+    for ep in eps:
+        try:
+            register_parser(ep.load())
+        except Exception as e:
+            warnings.warn('Cannot load parser %s from entry point: %s' % (ep.name, e))
+
+
+def get_parsers():
+    '''Get the registered parsers, including those declared as entry points
+
+    Returns:
+        list of DFTParser subclasses, by decreasing priority, then in order of registration
+    '''
+    _load_entry_points()
+    with _lock:
+        parsers = list(_registry)
+    return sorted(parsers, key=lambda p: -p.priority)
+
+
+def matches(parser_class, listing):
+    '''Check whether a directory matches the signature rules of a parser
+
+    Input:
+        parser_class - subclass of DFTParser
+        listing - DirectoryListing
+    Returns:
+        boolean, False if the parser declares no signature rules
+    '''
+    if not parser_class.signature_files and not parser_class.signature_headers:
+        return False
+    return all([listing.has_file(f) for f in parser_class.signature_files]) and \
+        all([listing.has_header(h) for h in parser_class.signature_headers])
+
+
+def detect_parsers(directory):
+    '''Find all the parsers whose signature rules match a directory
+
+    Input:
+        directory - String, FileSource or DirectoryListing, directory to check
+    Returns:
+        list of DFTParser subclasses, best match first
+    '''
+    listing = directory if isinstance(directory, DirectoryListing) else DirectoryListing(directory)
+    return [p for p in get_parsers() if matches(p, listing)]
+
+
+def detect_parser(directory):
+    '''Find the best parser for a directory, checking the parsers in order of rank
+    and stopping at the first match
+
+    Input:
+        directory - String, FileSource or DirectoryListing, directory to check
+    Returns:
+        DFTParser subclass, or None if no parser matches
+    '''
+    listing = directory if isinstance(directory, DirectoryListing) else DirectoryListing(directory)
+    for parser_class in get_parsers():
+        if matches(parser_class, listing):
+            return parser_class
+    return None
+
+
+def get_input_files(path):
+    '''List the files that are read to convert a calculation
+
+    Input:
+        path - String, path to a directory or an archive file
+    Returns:
+        list of String, paths of the files. If no parser matches the directory, all of its files
+    '''
+    if not os.path.isdir(path):
+        return [path]
+    listing = DirectoryListing(path)
+    parser_class = detect_parser(listing)
+    if parser_class is None:
+        return [os.path.join(path, f) for f in listing.files]
+    return [os.path.join(path, f) for f in sorted(parser_class.list_input_files(listing))]
@@ -1,12 +1,12 @@
 from pypif.obj import Property, Scalar
 
-from .base import DFTParser, Value_if_true
+from .base import DFTParser, Value_if_true, as_source
 import os
-from ase.calculators.vasp import Vasp
+from itertools import islice
+import numpy as np
 from ase.io.vasp import read_vasp, read_vasp_out
 from pypif.obj import Value, FileReference
 from dftparse.vasp.outcar_parser import OutcarParser
-from dftparse.vasp.eigenval_parser import EigenvalParser
 
 
 class VaspParser(DFTParser):
@@ -14,18 +14,79 @@ class VaspParser(DFTParser):
     Parser for VASP calculations
     '''
 
+    signature_files = ('OUTCAR',)
+
+    input_files = ('OUTCAR', 'INCAR', 'POSCAR', 'DOSCAR', 'EIGENVAL')
+
+    _outcar = None
+    '''Indexed OUTCAR, opened on first use'''
+
+    _outcar_header = None
+    '''Indexed start of the OUTCAR, before the first electronic iteration'''
+
+    _loop_header = '- Iteration'
+    '''Part of the line that starts each electronic iteration in the OUTCAR'''
+
+    _kpoints_header = 'Coordinates               Weight'
+    '''Header of the list of irreducible k-points and their weights in the OUTCAR'''
+
     def get_name(self): return "VASP"
+
+    def _get_outcar_index(self):
+        '''Get an indexed reader for the OUTCAR, which locates keywords without
+        parsing the whole file (and is memory-mapped for files on disk)
+
+        Returns: IndexedFile
+        '''
+        if self._outcar is None:
+            self._outcar = self._source.indexed(self._source.find('OUTCAR'))
+        return self._outcar
+
+    def _get_outcar_header(self):
+        '''Get an indexed reader for the start of the OUTCAR, where VASP prints the settings
+        of the calculation (POTCARs, parameters, etc.) before the electronic iterations
+
+        Settings that are absent are looked up there rather than in the whole OUTCAR.
+
+        Returns: IndexedFile
+        '''
+        if self._outcar_header is None:
+            self._outcar_header = self._get_outcar_index().head(self._loop_header)
+        return self._outcar_header
+
+    def _get_isif(self):
+        '''Read the ISIF parameter, which sets whether stresses are computed
+
+        Returns: int, or None if not found
+        '''
+        line = self._get_outcar_header().first('ISIF   =')
+        if line is None:
+            return None
+        return int(line.split('=')[1].split()[0])
     
     def test_if_from(self, directory):
-        # Check whether it has an INCAR file
-        return os.path.isfile(os.path.join(directory, 'OUTCAR'))
+        # Check whether it has an OUTCAR file, possibly compressed
+        return as_source(directory).find('OUTCAR') is not None
         
-    def get_output_structure(self):
-        self.atoms = read_vasp_out(os.path.join(self._directory, 'OUTCAR'))
-        return self.atoms
+    def close(self):
+        if self._outcar is not None:
+            self._outcar.close()
+        self._outcar = None
+        self._outcar_header = None
+
+    def clear_cache(self):
+        super(VaspParser, self).clear_cache()
+        # The OUTCAR is mapped again when it is next read
+        self.close()
+
+    def _read_output_structure(self):
+        # Read the copy held by the index, which is not decompressed again
+        name = self._source.path(self._source.find('OUTCAR'))
+        with self._get_outcar_index().open('r', name) as fp:
+            return read_vasp_out(fp)
 
     def get_outcar(self):
-        raw_path = os.path.join(self._directory, 'OUTCAR')
+        raw_path = self._source.path(self._source.find('OUTCAR'))
         if raw_path[0:2] == "./":
             raw_path = raw_path[2:]
         return Property(files=[FileReference(
@@ -33,7 +94,7 @@ class VaspParser(DFTParser):
         )])
 
     def get_incar(self):
-        raw_path = os.path.join(self._directory, 'INCAR')
+        raw_path = self._source.path(self._source.find('INCAR') or 'INCAR')
         if raw_path[0:2] == "./":
             raw_path = raw_path[2:]
         return Value(files=[FileReference(
@@ -41,7 +102,7 @@ class VaspParser(DFTParser):
         )])
 
     def get_poscar(self):
-        raw_path = os.path.join(self._directory, 'POSCAR')
+        raw_path = self._source.path(self._source.find('POSCAR') or 'POSCAR')
         if raw_path[0:2] == "./":
             raw_path = raw_path[2:]
         return Value(files=[FileReference(
@@ -49,220 +110,188 @@ class VaspParser(DFTParser):
         )])
 
     def get_cutoff_energy(self):
-        # Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR'), 'r') as fp:
-         # Look for ENCUT
-            for line in fp:
-                if "ENCUT" in line:
-                    words = line.split()
-                    return Value(scalars=[Scalar(value=float(words[2]))], units=words[3])
-                
+        # Look for ENCUT
+        line = self._get_outcar_index().first("ENCUT")
+        if line is not None:
+            words = line.split()
+            return Value(scalars=[Scalar(value=float(words[2]))], units=words[3])
+
         # Error handling: ENCUT not found
         raise Exception('ENCUT not found')
 
     @Value_if_true
     def uses_SOC(self):
-        # Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR')) as fp:
-        
-            #look for LSORBIT
-            for line in fp:
-                if "LSORBIT" in line:
-                    words = line.split()
-                    return words[2] == 'T'
-        
+        #look for LSORBIT
+        line = self._get_outcar_index().first("LSORBIT")
+        if line is not None:
+            words = line.split()
+            return words[2] == 'T'
+
         # Error handling: LSORBIT not found
         raise Exception('LSORBIT not found')
-        
+
     @Value_if_true
     def is_relaxed(self):
-        # Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR')) as fp:
-        
-            #  Look for NSW
-            for line in fp:
-                if "NSW" in line:
-                    words = line.split()
-                    return int(words[2]) != 0
-                
+        #  Look for NSW
+        line = self._get_outcar_index().first("NSW")
+        if line is not None:
+            words = line.split()
+            return int(words[2]) != 0
+
         # Error handling: NSW not found
         raise Exception('NSW not found')
-        
+
     def get_xc_functional(self):
-        # Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR')) as fp:
-        
-            # Look for TITEL
-            for line in fp:
-                if "TITEL" in line:
-                    words = line.split()
-                    return Value(scalars=[Scalar(value=words[2])])
-                    break
-            
+        # Look for TITEL
+        line = self._get_outcar_index().first("TITEL")
+        if line is not None:
+            words = line.split()
+            return Value(scalars=[Scalar(value=words[2])])
+
     def get_pp_name(self):
-        # Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR')) as fp:
-        
-            #initialize empty list to store pseudopotentials
-            pp = []
-            # Look for TITEL
-            for line in fp:
-                if "TITEL" in line:
-                    words = line.split()
-                    pp.append(words[3])
-            return Value(vectors=[[Scalar(value=x) for x in pp]])
-                
-        # Error handling: TITEL not found
-        raise Exception('TITEL not found')
-        
+        # Look for TITEL
+        pp = [line.split()[3] for line in self._get_outcar_header().all("TITEL")]
+        return Value(vectors=[[Scalar(value=x) for x in pp]])
+
     def get_KPPRA(self):
-        # Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR')) as fp:
-            #store the number of atoms and number of irreducible K-points
-            for line in fp:
-                if "NIONS" in line:
-                    words = line.split()
-                    NI = int(words[11])
-                elif "NKPTS" in line:
-                    words = line.split()
-                    NIRK = float(words[3])
-            #check if the number of k-points was reduced by VASP if so, sum all the k-points weight
-            if "irreducible" in open(os.path.join(self._directory, 'OUTCAR')).read():
-                fp.seek(0)
-                for line in fp:
-                    #sum all the k-points weight
-                    if "Coordinates               Weight" in line:
-                        NK=0; counter = 0
-                        for line in fp:
-                            if counter == NIRK:
-                                break
-                            NK += float(line.split()[3])
-                            counter += 1
-                return Value(scalars=[Scalar(value=NI*NK)])
-            #if k-points were not reduced KPPRA equals the number of atoms * number of irreducible k-points
-            else:
-                return Value(scalars=[Scalar(value=NI*NIRK)])
+        outcar = self._get_outcar_index()
+        if outcar.last("NIONS") is None or outcar.last("NKPTS") is None:
+            # Error handling: NKPTS or NIONS not found
+            raise Exception('NIONS, irredicuble or Coordinates not found')
 
-                
-        # Error handling: NKPTS or NIONS not found
-        raise Exception('NIONS, irredicuble or Coordinates not found')
+        #store the number of atoms and number of irreducible K-points
+        NI = int(outcar.last("NIONS").split()[11])
+        NIRK = float(outcar.last("NKPTS").split()[3])
+        #check if the number of k-points was reduced by VASP if so, sum all the k-points weight
+        if "irreducible" in outcar and self._kpoints_header in outcar:
+            # the weights follow the last k-point list header
+            NK = 0
+            lines = outcar.lines(outcar.last_offset(self._kpoints_header))
+            next(lines)
+            for counter, line in zip(range(int(NIRK)), lines):
+                NK += float(line.split()[3])
+            return Value(scalars=[Scalar(value=NI*NK)])
+        #if k-points were not reduced KPPRA equals the number of atoms * number of irreducible k-points
+        else:
+            return Value(scalars=[Scalar(value=NI*NIRK)])
 
     def _is_converged(self):
-        return self._call_ase(Vasp().read_convergence)
+        outcar = self._get_outcar_index()
+        line = outcar.first('EDIFF  ')
+        ediff = None if line is None else float(line.split()[2])
+
+        # Judge the last electronic loop, from whichever comes last: the line that labels the
+        # reason for leaving the loop (not printed when NELM is reached), or its last energy change
+        for line in outcar.reverse_lines():
+            if 'aborting loop' in line:
+                return 'EDIFF is reached' in line
+            if 'total energy-change' in line and 'MIXING' not in line:
+                if ediff is None:
+                    return None
+                split = line.split(':')
+                a = float(split[1].split('(')[0])
+                b = split[1].split('(')[1][0:-2]
+                # the second number sometimes lacks the "E" of its exponent, e.g. 0.2737684-111
+                if 'e' not in b.lower():
+                    bsplit = b.split('-')
+                    bsplit[-1] = 'e' + bsplit[-1]
+                    b = '-'.join(bsplit).replace('-e', 'e-')
+                b = float(b)
+                return [abs(a), abs(b)] < [ediff, ediff]
+        return None
 
     def get_total_energy(self):
-        return Property(scalars=[Scalar(value=self._call_ase(Vasp().read_energy)[0])], units='eV')
+        # Look for the free energy of the last ionic step, starting from the end of the OUTCAR
+        for line in self._get_outcar_index().reverse_lines():
+            if line.lower().startswith('  free  energy   toten'):
+                return Property(scalars=[Scalar(value=float(line.split()[-2]))], units='eV')
+        return None
 
     def get_version_number(self):
-        # Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR')) as fp:
-        
-            #look for vasp
-            for line in fp:
-                if "vasp" in line:
-                    words = line.split()
-                    return (words[0].strip('vasp.'))
-                    break
-        
+        #look for vasp
+        line = self._get_outcar_index().first("vasp")
+        if line is not None:
+            words = line.split()
+            return (words[0].strip('vasp.'))
+
         # Error handling: vasp not found
         raise Exception('vasp not found')
-        
+
     def get_U_settings(self):
-        #Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR')) as fp:
-            #Check if U is used
-            if "LDAU" in open(os.path.join(self._directory, 'OUTCAR')).read():
-                U_param = {}
-                atoms = []
-                #get the list of pseupotential used
-                for line in fp:
-                    if "TITEL" in line:
-                        atoms.append(line.split()[3])
-                    #Get the U type used
-                    if "LDAUTYPE" in line:
-                            U_param['Type'] = int(line.split()[-1])
-                atoms.reverse()
-                fp.seek(0)
-                #Get the L value
-                U_param['Values'] = {}
-                for line in fp:
-                    for atom, i in zip(atoms, range(len(atoms))):
-                        if "LDAUL" in line:
-                                U_param['Values'][atom] = {'L': int(line.split()[-1-i])}
-                fp.seek(0)
-                #Get the U value            
-                for line in fp:
-                    for atom, i in zip(atoms, range(len(atoms))):
-                        if "LDAUU" in line:
-                                U_param['Values'][atom]['U'] = float(line.split()[-1-i])
-                fp.seek(0)
-                #Get the J value
-                for line in fp:
-                    for atom, i in zip(atoms, range(len(atoms))):
-                        if "LDAUJ" in line:
-                                U_param['Values'][atom]['J'] = float(line.split()[-1-i])
-                return Value(**U_param)
-            #if U is not used, return None
-            else:
-                return None
-            
+        outcar = self._get_outcar_header()
+        #Check if U is used
+        if "LDAU" in outcar:
+            U_param = {}
+            #get the list of pseupotential used
+            atoms = [line.split()[3] for line in outcar.all("TITEL")]
+            #Get the U type used
+            if "LDAUTYPE" in outcar:
+                U_param['Type'] = int(outcar.last("LDAUTYPE").split()[-1])
+            atoms.reverse()
+            #Get the L, U and J values
+            U_param['Values'] = {}
+            for atom, i in zip(atoms, range(len(atoms))):
+                if "LDAUL" in outcar:
+                    U_param['Values'][atom] = {'L': int(outcar.last("LDAUL").split()[-1-i])}
+            for atom, i in zip(atoms, range(len(atoms))):
+                if "LDAUU" in outcar:
+                    U_param['Values'][atom]['U'] = float(outcar.last("LDAUU").split()[-1-i])
+            for atom, i in zip(atoms, range(len(atoms))):
+                if "LDAUJ" in outcar:
+                    U_param['Values'][atom]['J'] = float(outcar.last("LDAUJ").split()[-1-i])
+            return Value(**U_param)
+        #if U is not used, return None
+        else:
+            return None
+
     def get_vdW_settings(self):
         #define the name of the vdW methods in function of their keyword
         vdW_dict = {'BO':'optPBE-vdW', 'MK':'optB88-vdW', 'ML':'optB86b-vdW','RE':'vdW-DF','OR':'Klimes-Bowler-Michaelides'}
-        #Open up the OUTCAR
-        with open(os.path.join(self._directory, 'OUTCAR')) as fp:
-            #Check if vdW is used
-            if "LUSE_VDW" in open(os.path.join(self._directory, 'OUTCAR')).read():
-                #if vdW is used, get its keyword             
-                for line in fp:
-                    if "GGA     =" in line:
-                        words = line.split()
-                        return Value(scalars=[Scalar(value=vdW_dict[words[2]])])
-            #if vdW is not used, return None
-            else:
-                return None
-            
+        outcar = self._get_outcar_header()
+        #Check if vdW is used
+        if "LUSE_VDW" in outcar and "GGA     =" in outcar:
+            #if vdW is used, get its keyword
+            words = outcar.first("GGA     =").split()
+            return Value(scalars=[Scalar(value=vdW_dict[words[2]])])
+        #if vdW is not used, return None
+        else:
+            return None
+
     def get_pressure(self):
         #define pressure dictionnary because since when is kB = kbar? Come on VASP people
         pressure_dict = {'kB':'kbar'}
+        outcar = self._get_outcar_index()
         #Check if ISIF = 0 is used
-        if "ISIF   =      0" in open(os.path.join(self._directory, 'OUTCAR')).read():
+        if self._get_isif() == 0:
             #if ISIF = 0 is used, print this crap
             return None
         #if ISIF is not 0 then extract pressure and units
-        else:
-            #scan file in reverse to have the final pressure
-            for line in reversed(open(os.path.join(self._directory, 'OUTCAR')).readlines()):
-                if "external pressure" in line:
-                    words = line.split()
-                    return Property(scalars=[Scalar(value=float(words[3]))], units=pressure_dict[words[4]])
-                    break
-    
+        elif "external pressure" in outcar:
+            #use the last pressure to have the final pressure
+            words = outcar.last("external pressure").split()
+            return Property(scalars=[Scalar(value=float(words[3]))], units=pressure_dict[words[4]])
+
     def get_stresses(self):
-        #Check if ISIF = 0 is used
-        if "ISIF   =      0" in open(os.path.join(self._directory, 'OUTCAR')).read():
+        outcar = self._get_outcar_index()
+        #Check if ISIF = 0 or 1 is used
+        if self._get_isif() in (0, 1):
             return None
-        #Check if ISIF = 1 is used
-        elif "ISIF   =      1" in open(os.path.join(self._directory, 'OUTCAR')).read():
-            return None
-        else:
-            #scan file in reverse to have the final pressure
-            for line in open(os.path.join(self._directory, 'OUTCAR')).readlines():
-                if "in kB" in line:
-                    words = line.split()
-                    XX = float(words[2]); YY = float(words[3]); ZZ = float(words[4]); XY= float(words[5]); YZ = float(words[6]); ZX = float(words[7])
+        elif "in kB" in outcar:
+            #use the last stress tensor to have the final stresses
+            words = outcar.last("in kB").split()
+            XX = float(words[2]); YY = float(words[3]); ZZ = float(words[4]); XY= float(words[5]); YZ = float(words[6]); ZX = float(words[7])
             matrix = [[XX,XY,ZX],[XY,YY,YZ],[ZX,YZ,ZZ]]
             wrapped = [[Scalar(value=x) for x in y] for y in matrix]
             return Property(matrices=[wrapped], units='kbar')
-            
-         # Error handling: "in kB" not found
+
+        # Error handling: "in kB" not found
         raise Exception('in kB not found')
 
     def get_forces(self):
-        self.atoms = read_vasp_out(os.path.join(self._directory, 'OUTCAR'))
-        forces_raw = self.atoms.get_calculator().results['forces'].tolist()
+        atoms = self.get_output_structure()
+        forces_raw = atoms.calc.results['forces'].tolist()
         forces_wrapped = [[Scalar(value=x) for x in y] for y in forces_raw]
-        positions_raw = self.atoms.positions.tolist()
+        positions_raw = atoms.positions.tolist()
         positions_wrapped = [[Scalar(value=x) for x in y] for y in positions_raw]
         return Property(
             vectors=forces_wrapped,
@@ -270,102 +299,126 @@ class VaspParser(DFTParser):
         )
 
     @staticmethod
-    def _get_bandgap_from_bands(energies, nelec):
-        """Compute difference in conduction band min and valence band max"""
+    def _read_eigenval(f):
+        """Read the band energies from an EIGENVAL file
+
+        Input:
+            f - file object, EIGENVAL opened for reading text
+        Returns:
+            nelec - int, number of electrons
+            energies - 3D array, band energies indexed by (spin, k-point, band)
+        """
+        # The last number of the first line is ISPIN
+        n_spin = int(f.readline().split()[-1])
+        for i in range(4):
+            f.readline()
+        nelec, n_kpts, n_bands = [int(x) for x in f.readline().split()[:3]]
+        # Each k-point block is a line with the k-point and weight, then one line per band
+        lines = [l for l in f if len(l.split()) > 0]
+        band_lines = []
+        for k in range(n_kpts):
+            band_lines.extend(lines[k*(n_bands+1)+1:(k+1)*(n_bands+1)])
+        data = np.array(" ".join(band_lines).split(), dtype=float).reshape(n_kpts, n_bands, -1)
+        # Columns are the band index, the energy for each spin and, optionally, the occupancies
+        return nelec, data[:, :, 1:1+n_spin].transpose(2, 0, 1)
+
+    @staticmethod
+    def _get_band_edges(energies, nelec):
+        """Locate the band edges in each spin channel
+
+        Input:
+            energies - 3D array, band energies indexed by (spin, k-point, band)
+            nelec - number of electrons per spin channel
+        Returns:
+            dict of 1D arrays, with one entry per spin channel:
+                'vbm' and 'cbm' are the valence band maximum and conduction band minimum,
+                'gap' is the (possibly indirect) band gap and 'direct gap' the smallest direct gap
+        """
         nelec = int(nelec)
-        valence = [x[nelec-1] for x in energies]
-        conduction = [x[nelec] for x in energies]
-        return max(min(conduction) - max(valence), 0.0)
+        valence = energies[:, :, nelec-1]
+        conduction = energies[:, :, nelec]
+        vbm = valence.max(axis=1)
+        cbm = conduction.min(axis=1)
+        return {
+            'vbm': vbm,
+            'cbm': cbm,
+            'gap': np.maximum(cbm - vbm, 0.0),
+            'direct gap': np.maximum((conduction - valence).min(axis=1), 0.0)
+        }
 
     @staticmethod
-    def _get_bandgap_eigenval(eigenval_fname, outcar_fname):
+    def _get_bandgap_eigenval(f):
         """Get the bandgap from the EIGENVAL file"""
-        with open(outcar_fname, "r") as f:
-            parser = OutcarParser()
-            nelec = next(iter(filter(lambda x: "number of electrons" in x, parser.parse(f.readlines()))))["number of electrons"]
-        with open(eigenval_fname, "r") as f:
-            eigenval_info = list(EigenvalParser().parse(f.readlines()))
-        # spin_polarized = (2 == len(next(filter(lambda x: "kpoint" in x, eigenval_info))["occupancies"][0]))
-        # if spin_polarized:
-        all_energies = [zip(*x["energies"]) for x in eigenval_info if "energies" in x]
-        spin_energies = zip(*all_energies)
-        gaps = [VaspParser._get_bandgap_from_bands(x, nelec/2.0) for x in spin_energies]
-        return min(gaps)
+        nelec, energies = VaspParser._read_eigenval(f)
+        edges = VaspParser._get_band_edges(energies, nelec/2.0)
+        return float(edges['gap'].min())
+
+    @staticmethod
+    def _read_doscar(fp):
+        """Read the total density of states from a DOSCAR file
+
+        Input:
+            fp - file object, DOSCAR opened for reading text
+        Returns:
+            efermi - float, Fermi energy
+            data - 2D array, where the columns are the energy, the DOS of each
+                spin channel and the integrated DOS of each spin channel
+        """
+        for i in range(6):
+            l = fp.readline()
+        n_step = int(l.split()[2])
+        efermi = float(l.split()[3])
+        lines = list(islice(fp, n_step))
+        n_col = len(lines[0].split())
+        data = np.array(" ".join(lines).split(), dtype=float).reshape(n_step, n_col)
+        return efermi, data
 
     @staticmethod
-    def _get_bandgap_doscar(filename):
+    def _get_total_dos(data):
+        """Sum the DOS over the spin channels of a DOSCAR block read by _read_doscar"""
+        n_spin = (data.shape[1] - 1) // 2
+        return data[:, 1:1+n_spin].sum(axis=1)
+
+    @staticmethod
+    def _get_bandgap_doscar(fp):
         """Get the bandgap from the DOSCAR file"""
-        with open(filename) as fp:
-            for i in range(6):
-                l = fp.readline()
-            efermi = float(l.split()[3])
-            step1 = fp.readline().split()[0]
-            step2 = fp.readline().split()[0]
-            step_size = float(step2)-float(step1)
-            not_found = True
-            while not_found:
-                l = fp.readline().split()
-                e = float(l.pop(0))
-                dens = 0.0
-                for i in range(int(len(l)/2)):
-                    dens += float(l[i])
-                if e < efermi and dens > 1e-3:
-                    bot = e
-                elif e > efermi and dens > 1e-3:
-                    top = e
-                    not_found = False
-            if top - bot < step_size*2:
-                bandgap = 0.0
-            else:
-                bandgap = float(top - bot)
-
-        return bandgap
+        efermi, data = VaspParser._read_doscar(fp)
+        return VaspParser._get_bandgap_from_dos(data[:, 0], VaspParser._get_total_dos(data), efermi)
 
     def get_band_gap(self):
         """Get the bandgap, either from the EIGENVAL or DOSCAR files"""
-        doscar_path = os.path.join(self._directory, 'DOSCAR')
-        outcar_path = os.path.join(self._directory, 'OUTCAR')
-        eigenval_path = os.path.join(self._directory, 'EIGENVAL')
-
-        if os.path.isfile(outcar_path) and os.path.isfile(eigenval_path):
-            bandgap = VaspParser._get_bandgap_eigenval(eigenval_path, outcar_path)
-        elif os.path.isfile(doscar_path):
-            bandgap = VaspParser._get_bandgap_doscar(doscar_path)
+        doscar_name = self._source.find('DOSCAR')
+        eigenval_name = self._source.find('EIGENVAL')
+
+        if eigenval_name is not None:
+            with self._source.open_file(eigenval_name) as f:
+                bandgap = VaspParser._get_bandgap_eigenval(f)
+        elif doscar_name is not None:
+            with self._source.open_file(doscar_name) as fp:
+                bandgap = VaspParser._get_bandgap_doscar(fp)
         else:
             return None
         return Property(scalars=[Scalar(value=round(bandgap, 3))], units='eV')
                 
     def get_dos(self):
-        file_path = os.path.join(self._directory, 'DOSCAR')
-        if not os.path.isfile(file_path):
+        file_name = self._source.find('DOSCAR')
+        if file_name is None:
             return None
-        #open DOSCAR
-        with open(os.path.join(self._directory, 'DOSCAR')) as fp:
-            for i in range(6):
-                l = fp.readline()
-            n_step = int(l.split()[2])
-            energy = []; dos = []            
-            for i in range(n_step):
-                l = fp.readline().split()
-                e = float(l.pop(0))
-                energy.append(Scalar(value=e))
-                dens = 0
-                for j in range(int(len(l)/2)):
-                    dens += float(l[j])
-                dos.append(Scalar(value=dens))
-
-            # Convert to property
-            return Property(scalars=dos, units='number of states per unit cell',
-                            conditions=Value(name='energy', scalars=energy, units='eV'))
+        with self._source.open_file(file_name) as fp:
+            efermi, data = VaspParser._read_doscar(fp)
+        energy = [Scalar(value=e) for e in data[:, 0].tolist()]
+        dos = [Scalar(value=d) for d in VaspParser._get_total_dos(data).tolist()]
+
+        # Convert to property
+        return Property(scalars=dos, units='number of states per unit cell',
+                        conditions=Value(name='energy', scalars=energy, units='eV'))
 
     def get_total_magnetization(self):
-        file_path = os.path.join(self._directory, "OUTCAR")
-        if not os.path.isfile(file_path):
+        line = self._get_outcar_index().last(" number of electron ")
+        if line is None:
             return None
-        parser = OutcarParser()
-        with open(file_path, "r") as fp:
-            matches = list(filter(lambda x: "total magnetization" in x, parser.parse(fp.readlines())))
-        if len(matches) == 0:
+        match = next(iter(OutcarParser().parse([line])))
+        if "total magnetization" not in match:
             return None
-        total_magnetization = matches[-1]["total magnetization"]
+        total_magnetization = match["total magnetization"]
         return Property(scalars=[Scalar(value=total_magnetization)], units="Bohr")
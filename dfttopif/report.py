@@ -0,0 +1,189 @@
+'''Client of the service that scores the quality of VASP calculations
+
+The OUTCAR and INCAR files of a calculation are sent, in a tar archive built in memory,
+to the calval service, which returns a report and a score. Requests go through a pooled
+HTTP session, with timeouts and retries of failed connections and server errors.
+
+The address of the service can be changed with the DFTTOPIF_REPORT_URL environment
+variable, e.g. to point to a local server.
+
+Reports are cached, keyed by the contents of the OUTCAR and INCAR files, in the cache
+of the client or the one configured with the DFTTOPIF_REPORT_CACHE environment variable
+(see dfttopif.cache), so that the same calculation is only scored once.
+'''
+
+import io
+import os
+import json
+import tarfile
+import threading
+from dfttopif.cache import ReportCache, get_default_report_cache
+
+default_url = 'https://calval.citrination.com/validate'
+'''Address of the calval service'''
+
+
+def read_report_files(source):
+    '''Read the files of a calculation that are sent to the service
+
+    Input:
+        source - FileSource, files of the calculation
+    Returns:
+        list of (String, bytes), usual names (e.g., "OUTCAR") and decompressed contents of the files
+    '''
+    files = []
+    for name in ["OUTCAR", "INCAR"]:
+        with source.open_file(source.find(name) or name, 'rb') as fp:
+            files.append((name, fp.read()))
+    return files
+
+
+def make_tarball(files, root=''):
+    '''Pack the files of a calculation that are sent to the service
+
+    Input:
+        files - list of (String, bytes), names and contents of the files (see read_report_files)
+        root - String, directory of the files in the archive
+    Returns:
+        bytes, contents of a tar archive holding the files
+    '''
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode='w') as tar:
+        for name, data in files:
+            info = tarfile.TarInfo(os.path.join(root, name).lstrip("/"))
+            info.size = len(data)
+            tar.addfile(info, io.BytesIO(data))
+    return buf.getvalue()
+
+
+class QualityReportClient(object):
+    '''Client of the calval service
+
+    The HTTP session is created on first use, in each process, and is shared by
+    the threads of that process.
+    '''
+
+    def __init__(self, url=None, timeout=(10, 120), retries=3, backoff_factor=0.5, pool_size=10, cache=None):
+        '''Input:
+            url - String, address of the service. Defaults to DFTTOPIF_REPORT_URL, or `default_url`
+            timeout - float or (float, float), timeout of the requests in seconds, either
+                overall or to connect and to read the response
+            retries - int, number of times a failed request is retried
+            backoff_factor - float, factor of the exponential delay between retries
+            pool_size - int, maximum number of connections kept open
+            cache - ReportCache, cache of the reports, or String, path to its directory.
+                Defaults to the cache given by get_default_report_cache, if any
+        '''
+        self.url = (url or os.environ.get('DFTTOPIF_REPORT_URL') or default_url).rstrip('/')
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff_factor = backoff_factor
+        self.pool_size = pool_size
+        self.cache = ReportCache(cache) if isinstance(cache, str) else cache
+        self._session = None
+        self._lock = threading.Lock()
+
+    def __getstate__(self):
+        # Sessions and locks cannot be pickled, e.g. to send the client to worker processes
+        state = self.__dict__.copy()
+        state['_session'] = None
+        del state['_lock']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def session(self):
+        '''requests.Session, with pooled connections and retries'''
+        with self._lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                # Retry all methods, including POST, which is not idempotent by default
+                options = dict(total=self.retries, backoff_factor=self.backoff_factor,
+                               status_forcelist=(500, 502, 503, 504), raise_on_status=False)
+                try:
+                    retry = Retry(allowed_methods=None, **options)
+                except TypeError:
+                    # urllib3 < 1.26 names the option method_whitelist
+                    retry = Retry(method_whitelist=None, **options)
+                adapter = HTTPAdapter(max_retries=retry, pool_connections=self.pool_size,
+                                      pool_maxsize=self.pool_size)
+                session = requests.Session()
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._session = session
+            return self._session
+
+    def request(self, tarball, inline=True):
+        '''Request the quality report of a calculation
+
+        Input:
+            tarball - bytes, archive of the files of the calculation (see `make_tarball`)
+            inline - bool, whether to get the report as a JSON object, rather than as text
+        Returns:
+            (report, score), where the report is a dict if inline or a String otherwise,
+                or None if the service returned an error
+        '''
+        endpoint = '/json/tarfile' if inline else '/tarfile'
+        r = self.session.post(self.url + endpoint, data=tarball, timeout=self.timeout)
+        if r.status_code != 200:
+            print("Unable to generate quality report; request returned with status {}".format(r.status_code))
+            return None
+
+        if inline:
+            report = json.loads(r.json()[0])
+            score = report["score"]
+        else:
+            report = r.json()[0]
+            score = int(report.split('\n')[0].split()[-1]) # the score is the last token on the first line
+        return report, score
+
+    def report(self, source, inline=True):
+        '''Get the quality report of a calculation, from the cache if it was already scored
+
+        Input:
+            source - FileSource, files of the calculation
+            inline - bool, whether to get the report as a JSON object, rather than as text
+        Returns:
+            (report, score), or None if the service returned an error
+        '''
+        files = read_report_files(source)
+        cache = self.cache if self.cache is not None else get_default_report_cache()
+        key = None
+        if cache is not None:
+            key = cache.make_key(files, self.url, inline)
+            result = cache.get(key)
+            if result is not None:
+                return result
+
+        result = self.request(make_tarball(files, source.root), inline)
+        if result is not None and key is not None:
+            cache.put(key, *result)
+        return result
+
+    def close(self):
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+
+_default_clients = {}
+_default_lock = threading.Lock()
+
+
+def get_default_client():
+    '''Get the client of the service at the address given by DFTTOPIF_REPORT_URL, or `default_url`
+
+    Returns:
+        QualityReportClient, shared by the conversions of this process
+    '''
+    url = os.environ.get('DFTTOPIF_REPORT_URL') or default_url
+    with _default_lock:
+        if url not in _default_clients:
+            _default_clients[url] = QualityReportClient(url)
+        return _default_clients[url]
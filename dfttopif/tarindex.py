@@ -0,0 +1,197 @@
+'''Seek index of gzip-compressed tar archives, to read their members without decompressing the whole archive
+
+Listing the members of a .tar.gz archive, and reading one of them, means decompressing
+everything that comes before it, as gzip streams cannot be seeked. The index, stored
+next to the archive in a sidecar file (e.g., "calc.tar.gz.index"), records the name,
+offset and size of each member, so the archive never has to be scanned again.
+
+If the indexed_gzip package is installed, the index also records restart points of the
+gzip stream (in "calc.tar.gz.gzidx"): a member is then read by decompressing from the
+closest restart point before it, rather than from the start of the archive. Without
+indexed_gzip, the offsets still spare the scan of the archive, but reading a member
+that comes before the last one read decompresses the archive again from the start:
+tarfile_to_pif then reads the archive in a single pass instead of using the index.
+
+The index is rebuilt whenever the size or modification time of the archive changes.
+'''
+
+import os
+import io
+import gzip
+import json
+import uuid
+import tarfile
+from dfttopif.parsers.base import ArchiveSource, _select_members, _find_root
+
+try:
+    import indexed_gzip
+except ImportError:
+    indexed_gzip = None
+
+_index_version = 1
+
+
+def index_path(filename):
+    '''Get the path of the index of an archive'''
+    return filename + '.index'
+
+
+def _gzip_index_path(filename):
+    return filename + '.gzidx'
+
+
+def is_gzip_file(filename):
+    '''Whether a file is compressed with gzip, judging by its first bytes'''
+    with open(filename, 'rb') as fp:
+        return fp.read(2) == b'\x1f\x8b'
+
+
+def _stat(filename):
+    st = os.stat(filename)
+    return st.st_size, st.st_mtime_ns
+
+
+def _save_gzip_index(fp, filename):
+    '''Save the restart points of the gzip stream of an archive
+
+    Input:
+        fp - indexed_gzip.IndexedGzipFile, archive with its full index built
+        filename - String, path to the archive
+    Returns:
+        String, path to the saved restart points, or None if the directory of the
+            archive is not writable
+    '''
+    path = _gzip_index_path(filename)
+    temp_path = '%s.%s.tmp' % (path, uuid.uuid4().hex)
+    try:
+        fp.export_index(temp_path)
+        os.replace(temp_path, path)
+    except (IOError, OSError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        return None
+    return path
+
+
+def build_index(filename, spacing=1 << 22):
+    '''Index the members of a gzip-compressed tar archive
+
+    Input:
+        filename - String, path to the archive
+        spacing - int, distance in bytes between the restart points of the gzip
+            stream. Only used if indexed_gzip is installed
+    Returns:
+        dict, index of the archive (see `load_index`). The restart points are left out
+            if they cannot be saved
+    '''
+    size, mtime_ns = _stat(filename)
+    gzip_index = None
+    if indexed_gzip is not None:
+        # Restart points are recorded as the archive is read
+        with indexed_gzip.IndexedGzipFile(filename, spacing=spacing) as fp:
+            with tarfile.open(fileobj=fp, mode='r:') as tar:
+                members = tar.getmembers()
+            fp.build_full_index()
+            gzip_index = _save_gzip_index(fp, filename)
+    else:
+        with tarfile.open(filename, 'r:gz') as tar:
+            members = tar.getmembers()
+    return {
+        'version': _index_version,
+        'size': size,
+        'mtime_ns': mtime_ns,
+        'members': [[m.name, m.isdir(), m.isfile(), m.offset_data, m.size] for m in members],
+        'gzip_index': gzip_index is not None,
+    }
+
+
+def load_index(filename):
+    '''Load the index of an archive
+
+    Input:
+        filename - String, path to the archive
+    Returns:
+        dict with the name, whether it is a directory, whether it is a regular file, offset
+            and size of each member ("members"), or None if the archive has no index or
+            changed since it was indexed
+    '''
+    try:
+        with open(index_path(filename)) as fp:
+            index = json.load(fp)
+    except (IOError, OSError, ValueError):
+        return None
+    if index.get('version') != _index_version or [index['size'], index['mtime_ns']] != list(_stat(filename)):
+        return None
+    if index['gzip_index'] and (indexed_gzip is None or not os.path.isfile(_gzip_index_path(filename))):
+        index['gzip_index'] = False
+    return index
+
+
+def get_index(filename, spacing=1 << 22):
+    '''Get the index of an archive, building and saving it if needed
+
+    The index is not saved if the directory of the archive is not writable.
+
+    Input:
+        filename - String, path to the archive
+        spacing - int, distance in bytes between the restart points of the gzip stream
+    Returns:
+        dict, index of the archive (see `load_index`)
+    '''
+    index = load_index(filename)
+    if index is not None:
+        return index
+    index = build_index(filename, spacing)
+    # Write to a temporary file first, so that readers never see a partial index
+    temp_path = '%s.%s.tmp' % (index_path(filename), uuid.uuid4().hex)
+    try:
+        with open(temp_path, 'w') as fp:
+            json.dump(index, fp)
+        os.replace(temp_path, index_path(filename))
+    except (IOError, OSError):
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+    return index
+
+
+class IndexedTarSource(ArchiveSource):
+    '''Files of the calculation in a gzip-compressed tar archive, read using its index
+
+    The calculation is in the first top-level directory of the archive, if any, as
+    with `TarSource.find_root`.
+    '''
+
+    def __init__(self, filename, index=None, exclude=None):
+        '''Input:
+            filename - String, path to the archive
+            index - dict, index of the archive. Defaults to the one given by `get_index`
+            exclude - list of String, glob patterns of the names of members to leave out.
+                Defaults to `archive_exclude`
+        '''
+        if index is None:
+            index = get_index(filename)
+        self.filename = filename
+        self._gzip_index = _gzip_index_path(filename) if index['gzip_index'] else None
+        self._fp = None
+        self.root = _find_root([(name, isdir) for name, isdir, isfile, offset, size in index['members']])
+        self._members = _select_members([(name, (offset, size))
+                                         for name, isdir, isfile, offset, size in index['members'] if isfile],
+                                        self.root, exclude)
+
+    def _open_member(self, member):
+        offset, size = member
+        if self._fp is None:
+            # The archive is opened once, and its restart points are loaded once
+            if indexed_gzip is not None:
+                self._fp = indexed_gzip.IndexedGzipFile(self.filename)
+                if self._gzip_index is not None:
+                    self._fp.import_index(self._gzip_index)
+            else:
+                self._fp = gzip.open(self.filename, 'rb')
+        self._fp.seek(offset)
+        return io.BytesIO(self._fp.read(size))
+
+    def close(self):
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
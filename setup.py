@@ -1,17 +1,26 @@
 from setuptools import setup, find_packages
 
+# Read the version without importing the package and its dependencies
+version = {}
+with open('dfttopif/version.py') as f:
+    exec(f.read(), version)
+
 setup(
     name='dfttopif',
-    version='0.3.1',
+    version=version['__version__'],
     description='Library for parsing Density Functional Theory calculations',
     url='https://github.com/CitrineInformatics/pif-dft',
+    python_requires='>=3.5',
     install_requires=[
         'ase',
+        'numpy',
         'pypif>=2.0.1,<3',
         'dftparse>=0.2.1'
     ],
     extras_require={
         'report': ["requests"],
+        'zstd': ["zstandard"],
+        'index': ["indexed_gzip"],
     },
     packages=find_packages(exclude=('tests', 'docs')),
     entry_points={
@@ -0,0 +1,26 @@
+import unittest
+from dfttopif.parsers.abinit import AbinitParser
+from dfttopif.parsers.base import TarSource
+from ..test_pif import unpack_example, delete_example
+import tarfile
+import os
+
+class TestAbinitParser(unittest.TestCase):
+
+    def test_Si_static(self):
+        """Make sure the parser reads the calculation from a directory or straight from its archive"""
+        archive = os.path.join('examples', 'abinit', 'abinit_Si_static.tar.gz')
+        unpack_example(archive)
+        try:
+            parser = AbinitParser('abinit_Si_static')
+            self.assertEqual('ABINIT', parser.get_name())
+            self.assertEqual('Si_static', parser._get_label())
+        finally:
+            delete_example('abinit_Si_static')
+
+        with tarfile.open(archive) as tar:
+            parser = AbinitParser(TarSource(tar, TarSource.find_root(tar)))
+            self.assertEqual('Si_static', parser._get_label())
+
+if __name__ == '__main__':
+    unittest.main()
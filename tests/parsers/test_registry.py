@@ -0,0 +1,69 @@
+import unittest
+from dfttopif.parsers import VaspParser, PwscfParser, detect_parser, detect_parsers, register_parser, get_parsers
+from dfttopif import directory_to_pif
+from dfttopif.parsers.base import DFTParser, DirectorySource
+from dfttopif.parsers import registry
+from pypif.obj import Property, Scalar
+from ..test_pif import unpack_example, delete_example
+from unittest import mock
+import os
+
+
+class TestParserRegistry(unittest.TestCase):
+
+    def test_detect(self):
+        """Make sure the parser of each example is detected from its files"""
+        for code, name, parser in [('vasp', 'AlNi_static_LDA', VaspParser),
+                                   ('pwscf', 'TiO2.vcrelax', PwscfParser),
+                                   ('abinit', 'abinit_Si_static', None)]:
+            unpack_example(os.path.join('examples', code, name + '.tar.gz'))
+            self.assertEqual(parser, detect_parser(name))
+            self.assertEqual([parser] if parser else [], detect_parsers(name))
+            delete_example(name)
+
+    def test_register(self):
+        """Make sure parsers from other packages can join the registry"""
+        class OtherParser(DFTParser):
+            signature_files = ('OUTCAR',)
+            priority = 1
+
+        try:
+            register_parser(OtherParser)
+            self.assertEqual(OtherParser, get_parsers()[0])
+
+            unpack_example(os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'))
+            self.assertEqual([OtherParser, VaspParser], detect_parsers('AlNi_static_LDA'))
+            delete_example('AlNi_static_LDA')
+        finally:
+            registry._registry.remove(OtherParser)
+
+    def test_partial_parser(self):
+        """Make sure parsers that only define some of the getters can be created"""
+        class PartialParser(DFTParser):
+            def test_if_from(self, directory):
+                return True
+
+            def get_total_energy(self):
+                return Property(scalars=[Scalar(value=-1.0)], units='eV')
+
+        parser = PartialParser('.')
+        self.assertFalse(hasattr(parser, 'get_forces'))
+        energy = parser.get_total_energy()
+        self.assertIs(energy, parser.get_total_energy())
+        self.assertEqual(1, parser.cache_misses['get_total_energy'])
+
+    def test_detect_once(self):
+        """Make sure the start of each file is read once, when detecting the parser and creating it"""
+        unpack_example(os.path.join('examples', 'pwscf', 'NaF.scf.tar.gz'))
+        try:
+            read_header = DirectorySource.read_header
+            with mock.patch.object(DirectorySource, 'read_header', autospec=True, side_effect=read_header) as m:
+                directory_to_pif('NaF.scf', quality_report=False)
+            names = [c[0][1] for c in m.call_args_list]
+            self.assertIn('aiida.out', names)
+            self.assertEqual(sorted(set(names)), sorted(names))
+        finally:
+            delete_example('NaF.scf')
+
+if __name__ == '__main__':
+    unittest.main()
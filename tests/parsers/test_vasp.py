@@ -3,7 +3,12 @@ from dfttopif.parsers import VaspParser
 from ..test_pif import unpack_example, delete_example
 from pypif.obj.common.value import Value
 import os
+import bz2
+import gzip
+from unittest import mock
+from dfttopif.parsers import base
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 
 class TestVASPParser(unittest.TestCase):
         
@@ -77,6 +82,97 @@ class TestVASPParser(unittest.TestCase):
         self._evaluate_AlNi(parser)
         delete_example('AlNi_static_LDA')
 
+    def test_unconverged_last_step(self):
+        """Make sure convergence is judged on the last electronic loop, not the first"""
+        parser = self.get_parser('AlNi_static_LDA')
+        self.assertTrue(parser.is_converged().scalars[0].value)
+
+        # Append an ionic step whose electronic loop stopped at NELM, without reaching EDIFF
+        with open(os.path.join('AlNi_static_LDA', 'OUTCAR'), 'a') as fp:
+            fp.write(' total energy-change (2. order) :-0.1994976E+01  (-0.1982463E+01)\n')
+            fp.write(' total energy-change (2. order) : 0.3520406E-02  (-0.2790314E-02)\n')
+        parser = VaspParser('AlNi_static_LDA')
+        self.assertFalse(parser.is_converged().scalars[0].value)
+        delete_example('AlNi_static_LDA')
+
+    def test_AlNi_compressed(self):
+        """Make sure AlNi also parses when its output files are compressed"""
+        unpack_example(os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'))
+        for name, ext, opener in [('OUTCAR', '.gz', gzip.open), ('DOSCAR', '.bz2', bz2.BZ2File), ('EIGENVAL', '.gz', gzip.open)]:
+            path = os.path.join('AlNi_static_LDA', name)
+            with open(path, 'rb') as src, opener(path + ext, 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.unlink(path)
+        # The OUTCAR is only decompressed once
+        opened = []
+        gunzip = base._decompressors['.gz']
+        with mock.patch.dict(base._decompressors, {'.gz': lambda path: opened.append(path) or gunzip(path)}):
+            parser = VaspParser('AlNi_static_LDA')
+            self._evaluate_AlNi(parser)
+        self.assertEqual(1, opened.count(os.path.join('AlNi_static_LDA', 'OUTCAR.gz')))
+        self.assertEqual('AlNi_static_LDA/OUTCAR.gz', parser.get_outcar().files[0].relative_path)
+        delete_example('AlNi_static_LDA')
+
+    def test_structure_cache(self):
+        """Make sure the output structure is only read once, until the cache is cleared"""
+        parser = self.get_parser('AlNi_static_LDA')
+        strc = parser.get_output_structure()
+        self.assertIs(strc, parser.get_output_structure())
+        self.assertEqual('AlNi', parser.get_composition())
+        parser.clear_cache()
+        self.assertIsNot(strc, parser.get_output_structure())
+        delete_example('AlNi_static_LDA')
+
+    def test_getter_cache(self):
+        """Make sure each getter is only computed once, until the cache is cleared"""
+        parser = self.get_parser('AlNi_static_LDA')
+        energy = parser.get_total_energy()
+        self.assertIs(energy, parser.get_total_energy())
+        self.assertEqual(1, parser.cache_misses['get_total_energy'])
+        self.assertEqual(1, parser.cache_hits['get_total_energy'])
+
+        parser.clear_cache()
+        self.assertIsNot(energy, parser.get_total_energy())
+        self.assertEqual(2, parser.cache_misses['get_total_energy'])
+        delete_example('AlNi_static_LDA')
+
+    def test_absent_settings(self):
+        """Make sure settings that are absent are only looked up in the start of the OUTCAR"""
+        parser = self.get_parser('AlNi_static_LDA')
+        self.assertIsNone(parser.get_U_settings())
+        self.assertIsNone(parser.get_vdW_settings())
+        self.assertEqual(2, parser._get_isif())
+        self.assertEqual([], parser._get_outcar_header()._offsets['LDAU'])
+        self.assertNotIn('LDAU', parser._get_outcar_index()._offsets)
+
+        # Lookups that find nothing are cached too
+        outcar = parser._get_outcar_index()
+        self.assertNotIn('no such keyword', outcar)
+        self.assertEqual([], outcar._offsets['no such keyword'])
+        self.assertIsNone(outcar.last('no such keyword'))
+        delete_example('AlNi_static_LDA')
+
+    def test_threads(self):
+        """Make sure directories can be parsed concurrently from several threads"""
+        names = ['AlNi_static_LDA', 'perov_relax_U', 'vdW']
+        for name in names:
+            unpack_example(os.path.join('examples', 'vasp', name + '.tar.gz'))
+
+        def parse(name):
+            parser = VaspParser(name)
+            return (parser.is_converged().scalars[0].value,
+                    parser.get_total_energy().scalars[0].value,
+                    parser.get_composition())
+
+        cwd = os.getcwd()
+        expected = [parse(name) for name in names]
+        with ThreadPoolExecutor(max_workers=len(names)) as executor:
+            self.assertEqual(expected * 4, list(executor.map(parse, names * 4)))
+        self.assertEqual(cwd, os.getcwd())
+
+        for name in names:
+            delete_example(name)
+
     def _evaluate_AlNi(self, parser):
         """Test that AlNi was parsed correctly"""
         
@@ -0,0 +1,85 @@
+import unittest
+from dfttopif import directory_to_pif, directories_to_pifs, PwscfParser
+from dfttopif.cache import PifCache, get_parser_version
+from dfttopif.version import __version__
+from .test_pif import unpack_example, delete_example
+from pypif import pif
+from unittest import mock
+import tempfile
+import types
+import sys
+import json
+import shutil
+import os
+
+
+class TestPifCache(unittest.TestCase):
+    '''
+    Tests for the cache of converted calculations
+    '''
+
+    def setUp(self):
+        self.cache = PifCache(tempfile.mkdtemp())
+        unpack_example(os.path.join('examples', 'pwscf', 'NaF.scf.tar.gz'))
+
+    def tearDown(self):
+        delete_example('NaF.scf')
+        shutil.rmtree(self.cache.directory)
+
+    def test_hit(self):
+        expected = json.loads(pif.dumps(directory_to_pif('NaF.scf', quality_report=False)))
+        result = directory_to_pif('NaF.scf', quality_report=False, cache=self.cache)
+        self.assertEqual(expected, json.loads(pif.dumps(result)))
+        self.assertEqual(1, len(self.cache._entries()))
+
+        # A copy of the calculation, somewhere else, is read from the cache
+        copy = os.path.join(self.cache.directory, 'copy')
+        shutil.copytree('NaF.scf', copy)
+        key = self.cache.make_key(copy, PwscfParser, quality_report=False)
+        self.assertEqual(expected, json.loads(pif.dumps(self.cache.get(key))))
+        result = directory_to_pif(copy, quality_report=False, cache=self.cache)
+        self.assertEqual(expected, json.loads(pif.dumps(result)))
+        self.assertEqual(1, len(self.cache._entries()))
+        shutil.rmtree(copy)
+
+        # A change to the files leads to a new entry
+        with open(os.path.join('NaF.scf', 'aiida.out'), 'a') as fp:
+            fp.write('\n')
+        directory_to_pif('NaF.scf', quality_report=False, cache=self.cache)
+        self.assertEqual(2, len(self.cache._entries()))
+
+        # The cache can be sent to worker processes
+        results = list(directories_to_pifs(['NaF.scf'], max_workers=1, quality_report=False, cache=self.cache))
+        self.assertEqual('FNa', results[0][1].chemical_formula)
+
+    def test_parser_version(self):
+        # A new version of the parser leads to a new key
+        key = self.cache.make_key('NaF.scf', PwscfParser, quality_report=False)
+        self.assertEqual(key, self.cache.make_key('NaF.scf', PwscfParser, quality_report=False))
+        with mock.patch.object(PwscfParser, 'parser_version', '2.0'):
+            self.assertNotEqual(key, self.cache.make_key('NaF.scf', PwscfParser, quality_report=False))
+
+        # Parsers from other packages default to the version of their package
+        package = types.ModuleType('otherparsers')
+        package.__version__ = '1.2'
+        OtherParser = type('OtherParser', (PwscfParser,), {'__module__': 'otherparsers.pwscf'})
+        with mock.patch.dict(sys.modules, {'otherparsers': package}):
+            self.assertEqual('1.2', get_parser_version(OtherParser))
+        self.assertEqual(__version__, get_parser_version(PwscfParser))
+
+    def test_eviction(self):
+        result = directory_to_pif('NaF.scf', quality_report=False)
+        self.cache.put('a' * 64, result)
+        size = self.cache._entries()[0][0]
+
+        # Only the most recently used entries are kept
+        self.cache.max_size = int(size * 2.5)
+        self.cache.put('b' * 64, result)
+        self.assertIsNotNone(self.cache.get('a' * 64))
+        self.cache.put('c' * 64, result)
+        self.assertEqual(2, len(self.cache._entries()))
+        self.assertIsNone(self.cache.get('b' * 64))
+        self.assertIsNotNone(self.cache.get('a' * 64))
+
+if __name__ == '__main__':
+    unittest.main()
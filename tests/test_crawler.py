@@ -0,0 +1,44 @@
+import unittest
+from dfttopif import find_calculations, crawl_to_pifs
+import tarfile
+import tempfile
+import shutil
+import os
+
+
+class TestCrawler(unittest.TestCase):
+    '''
+    Tests for the tool that finds calculations in a tree of directories
+    '''
+
+    def setUp(self):
+        # Build a tree of calculations:
+        #   project/vasp/AlNi_static_LDA, project/pwscf/a/NaF.scf, project/.hidden/vdW,
+        #   project/pwscf/NaF.scf.tar.gz and project/empty
+        self.root = tempfile.mkdtemp()
+        for code, name, where in [('vasp', 'AlNi_static_LDA', 'vasp'), ('pwscf', 'NaF.scf', os.path.join('pwscf', 'a')),
+                                  ('vasp', 'vdW', '.hidden')]:
+            with tarfile.open(os.path.join('examples', code, name + '.tar.gz')) as tp:
+                tp.extractall(os.path.join(self.root, where))
+        shutil.copy(os.path.join('examples', 'pwscf', 'NaF.scf.tar.gz'), os.path.join(self.root, 'pwscf'))
+        os.makedirs(os.path.join(self.root, 'empty'))
+
+    def tearDown(self):
+        shutil.rmtree(self.root)
+
+    def test_find(self):
+        paths = [os.path.relpath(p, self.root) for p in find_calculations(self.root)]
+        self.assertEqual([os.path.join('pwscf', 'a', 'NaF.scf'), os.path.join('vasp', 'AlNi_static_LDA')], paths)
+
+        paths = [os.path.relpath(p, self.root) for p in find_calculations(self.root, prune=[], include_archives=True)]
+        self.assertEqual([os.path.join('.hidden', 'vdW'), os.path.join('pwscf', 'NaF.scf.tar.gz'),
+                          os.path.join('pwscf', 'a', 'NaF.scf'), os.path.join('vasp', 'AlNi_static_LDA')], paths)
+
+    def test_convert(self):
+        results = dict(crawl_to_pifs(self.root, processes=False, max_workers=2, quality_report=False))
+        self.assertEqual(2, len(results))
+        self.assertEqual('FNa', results[os.path.join(self.root, 'pwscf', 'a', 'NaF.scf')].chemical_formula)
+        self.assertEqual('AlNi', results[os.path.join(self.root, 'vasp', 'AlNi_static_LDA')].chemical_formula)
+
+if __name__ == '__main__':
+    unittest.main()
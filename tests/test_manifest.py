@@ -0,0 +1,69 @@
+import unittest
+from dfttopif import directories_to_pifs
+from dfttopif.manifest import Manifest, get_input_files
+from .test_pif import unpack_example, delete_example
+import tempfile
+import shutil
+import os
+
+
+class TestManifest(unittest.TestCase):
+    '''
+    Tests for the incremental conversion of calculations
+    '''
+
+    def setUp(self):
+        self.names = ['AlNi_static_LDA', 'NaF.scf', 'abinit_Si_static']
+        unpack_example(os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'))
+        unpack_example(os.path.join('examples', 'pwscf', 'NaF.scf.tar.gz'))
+        unpack_example(os.path.join('examples', 'abinit', 'abinit_Si_static.tar.gz'))
+        self.db = os.path.join(tempfile.mkdtemp(), 'manifest.db')
+
+    def tearDown(self):
+        for name in self.names:
+            delete_example(name)
+        shutil.rmtree(os.path.dirname(self.db))
+
+    def convert(self, paths, manifest):
+        return [path for path, result in directories_to_pifs(paths, processes=False, manifest=manifest,
+                                                              quality_report=False)]
+
+    def test_input_files(self):
+        self.assertEqual(['DOSCAR', 'EIGENVAL', 'INCAR', 'OUTCAR', 'POSCAR'],
+                         [os.path.basename(f) for f in get_input_files('AlNi_static_LDA')])
+        self.assertEqual(['aiida.in', 'aiida.out'], [os.path.basename(f) for f in get_input_files('NaF.scf')])
+
+    def test_incremental(self):
+        # There is no parser for the ABINIT calculation, whose conversion fails
+        paths = self.names
+        with Manifest(self.db) as manifest:
+            self.assertEqual(paths, self.convert(paths, manifest))
+            self.assertEqual('done', manifest.get('NaF.scf')['status'])
+            self.assertEqual('error', manifest.get('abinit_Si_static')['status'])
+
+        # Nothing changed: all calculations are skipped, including the failed one
+        with Manifest(self.db) as manifest:
+            self.assertEqual([], self.convert(paths, manifest))
+        with Manifest(self.db, retry_errors=True) as manifest:
+            self.assertEqual(['abinit_Si_static'], self.convert(paths, manifest))
+
+        # Only the modified calculation is converted again
+        with open(os.path.join('NaF.scf', 'aiida.out'), 'a') as fp:
+            fp.write('\n')
+        with Manifest(self.db) as manifest:
+            self.assertEqual(['NaF.scf'], self.convert(paths, manifest))
+
+    def test_resume(self):
+        # Stop after the first result
+        with Manifest(self.db) as manifest:
+            results = directories_to_pifs(self.names, processes=False, manifest=manifest, quality_report=False)
+            next(results)
+            next(results)
+            results.close()
+
+        # The run resumes with the calculation that was not handed over
+        with Manifest(self.db) as manifest:
+            self.assertEqual(['NaF.scf', 'abinit_Si_static'], self.convert(self.names, manifest))
+
+if __name__ == '__main__':
+    unittest.main()
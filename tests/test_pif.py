@@ -1,10 +1,16 @@
 import unittest
-from dfttopif import directory_to_pif
+from dfttopif import directory_to_pif, directories_to_pifs, tarfile_to_pif, archive_to_pif
+import io
 import tarfile
+import zipfile
+import tempfile
 import os
 import shutil
 from pypif import pif
 import glob
+import gc
+from unittest import mock
+from dfttopif.parsers.base import TarSource, StreamTarSource
 
 def delete_example(name):
     '''Delete example files that were unpacked
@@ -77,6 +83,158 @@ class TestPifGenerator(unittest.TestCase):
             
             # Delete files
             delete_example(name)
-        
+
+    def test_tarfile(self):
+        '''
+        Test parsing calculations straight from their archive
+        '''
+
+        for file in glob.glob(os.path.join('examples','*','*.tar.gz')):
+            name = ".".join(os.path.basename(file).split(".")[:-2])
+            if 'abinit' in file:
+                continue
+            files = sorted(os.listdir('.'))
+            result = tarfile_to_pif(file, quality_report=False)
+
+            # Nothing is extracted
+            self.assertEqual(files, sorted(os.listdir('.')))
+
+            # Only the files read by the parser are extracted, to a directory that is then deleted
+            self.assertEqual(pif.dumps(tarfile_to_pif(file, extract=True, quality_report=False)), pif.dumps(result))
+            self.assertEqual(files, sorted(os.listdir('.')))
+
+            unpack_example(file)
+            self.assertEqual(pif.dumps(directory_to_pif(name, quality_report=False)), pif.dumps(result))
+            delete_example(name)
+
+        # Excluded members are not read
+        result = tarfile_to_pif(os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'), quality_report=False,
+                                exclude=['DOSCAR', 'EIGENVAL'])
+        self.assertNotIn('Band Gap Energy', [p.name for p in result.properties])
+
+    def test_tar_single_pass(self):
+        '''
+        Test that the members of a compressed archive are read in one forward pass
+        '''
+
+        file = os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz')
+        expected = pif.dumps(tarfile_to_pif(file, quality_report=False))
+        with tarfile.open(file) as tar:
+            source = TarSource(tar, TarSource.find_root(tar))
+            read = []
+            extractfile = tar.extractfile
+            with mock.patch.object(tar, 'extractfile', side_effect=lambda m: read.append(m.offset_data) or extractfile(m)):
+                # Members opened after one that comes later in the archive are not read again
+                for name in ['POSCAR', 'OUTCAR', 'INCAR']:
+                    with source.open_file(name, 'rb') as fp:
+                        self.assertEqual(extractfile(source.member(name)).read(), fp.read())
+                self.assertEqual(pif.dumps(directory_to_pif(source, quality_report=False)), expected)
+        self.assertEqual(sorted(set(read)), read)
+
+    def test_tar_spill(self):
+        '''
+        Test that large members of a compressed archive are written to disk, rather than kept in memory
+        '''
+
+        file = os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz')
+        expected = pif.dumps(tarfile_to_pif(file, quality_report=False))
+        with open(file, 'rb') as fp:
+            source = StreamTarSource(fp, spill_size=1 << 16)
+        temp_dir = source._temp_dir
+        self.assertIn(source.member('OUTCAR'), [os.path.join(temp_dir, f) for f in os.listdir(temp_dir)])
+        self.assertIsInstance(source.member('INCAR'), bytes)
+        self.assertEqual(pif.dumps(directory_to_pif(source, quality_report=False)), expected)
+        source.close()
+        self.assertFalse(os.path.exists(temp_dir))
+
+    def test_archive_formats(self):
+        '''
+        Test parsing calculations from zip, tar.xz and tar.zst archives
+        '''
+
+        try:
+            import zstandard
+        except ImportError:
+            zstandard = None
+        temp_dir = tempfile.mkdtemp()
+        for file in [os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'),
+                     os.path.join('examples', 'pwscf', 'TiO2.vcrelax.tar.gz')]:
+            name = ".".join(os.path.basename(file).split(".")[:-2])
+            expected = pif.dumps(tarfile_to_pif(file, quality_report=False))
+
+            # Repack the example in the other formats
+            with tarfile.open(file) as tar:
+                members = [(m, tar.extractfile(m).read() if m.isfile() else None) for m in tar.getmembers()]
+            archives = [os.path.join(temp_dir, name + '.zip'), os.path.join(temp_dir, name + '.tar.xz')]
+            with zipfile.ZipFile(archives[0], 'w', zipfile.ZIP_DEFLATED) as zf:
+                for member, data in members:
+                    if data is not None:
+                        zf.writestr(member.name, data)
+            with tarfile.open(archives[1], 'w:xz') as tar:
+                for member, data in members:
+                    tar.addfile(member, io.BytesIO(data) if data is not None else None)
+            if zstandard is not None:
+                archives.append(os.path.join(temp_dir, name + '.tar.zst'))
+                with open(archives[1].replace('.tar.xz', '.tar'), 'wb') as fp:
+                    with tarfile.open(fileobj=fp, mode='w') as tar:
+                        for member, data in members:
+                            tar.addfile(member, io.BytesIO(data) if data is not None else None)
+                with open(archives[1].replace('.tar.xz', '.tar'), 'rb') as fp:
+                    data = fp.read()
+                with open(archives[2], 'wb') as fp:
+                    fp.write(zstandard.ZstdCompressor().compress(data))
+
+            for archive in archives:
+                self.assertEqual(pif.dumps(archive_to_pif(archive, quality_report=False)), expected)
+                self.assertEqual(pif.dumps(archive_to_pif(archive, extract=True, quality_report=False)), expected)
+        shutil.rmtree(temp_dir)
+
+    @unittest.skipUnless(os.path.isdir('/proc/self/fd'), 'open files are listed in /proc')
+    def test_open_files(self):
+        '''
+        Test that converting a directory leaves no file open, even without the garbage collector
+        '''
+
+        unpack_example(os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'))
+        unpack_example(os.path.join('examples', 'pwscf', 'NaF.scf.tar.gz'))
+        gc.disable()
+        try:
+            opened = len(os.listdir('/proc/self/fd'))
+            for i in range(5):
+                directory_to_pif('AlNi_static_LDA', quality_report=False)
+                directory_to_pif('NaF.scf', quality_report=False)
+            self.assertEqual(opened, len(os.listdir('/proc/self/fd')))
+        finally:
+            gc.enable()
+            delete_example('AlNi_static_LDA')
+            delete_example('NaF.scf')
+
+    def test_batch(self):
+        '''
+        Test converting several directories in parallel
+        '''
+
+        files = sorted(glob.glob(os.path.join('examples','pwscf','*.tar.gz')))
+        names = [".".join(os.path.basename(file).split(".")[:-2]) for file in files]
+        for file in files:
+            unpack_example(file)
+        expected = [pif.dumps(directory_to_pif(name, quality_report=False)) for name in names]
+
+        for processes in [True, False]:
+            # Ordered results, with errors reported next to their path
+            results = list(directories_to_pifs(names + ['missing'], max_workers=2, processes=processes,
+                                               max_pending=3, quality_report=False))
+            self.assertEqual(names + ['missing'], [path for path, result in results])
+            self.assertEqual(expected, [pif.dumps(result) for path, result in results[:-1]])
+            self.assertTrue(isinstance(results[-1][1], Exception))
+
+            # Unordered results
+            results = dict(directories_to_pifs(names, max_workers=2, processes=processes, ordered=False,
+                                               quality_report=False))
+            self.assertEqual(expected, [pif.dumps(results[name]) for name in names])
+
+        for name in names:
+            delete_example(name)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,153 @@
+import unittest
+from dfttopif import directory_to_pif, directories_to_pifs
+from dfttopif.report import QualityReportClient
+from dfttopif.cache import ReportCache
+from dfttopif.parsers.base import DirectorySource
+from .test_pif import unpack_example, delete_example
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import threading
+import tempfile
+import shutil
+import tarfile
+import json
+import time
+import io
+import os
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    '''Stub of the calval service, which fails the first `failures` requests'''
+
+    failures = 0
+    delay = 0
+    requests = []
+
+    def do_POST(self):
+        data = self.rfile.read(int(self.headers['Content-Length']))
+        with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+            StubHandler.requests.append((self.path, sorted(os.path.basename(n) for n in tar.getnames())))
+        time.sleep(StubHandler.delay)
+        if StubHandler.failures > 0:
+            StubHandler.failures -= 1
+            self.send_response(503)
+            self.end_headers()
+            return
+        if self.path.endswith('/json/tarfile'):
+            body = [json.dumps({'score': 7, 'tests': []})]
+        else:
+            body = ['Score: 7\nAll tests passed']
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestQualityReport(unittest.TestCase):
+    '''
+    Tests for the client of the quality report service, against a local stub
+    '''
+
+    @classmethod
+    def setUpClass(cls):
+        cls.server = HTTPServer(('127.0.0.1', 0), StubHandler)
+        cls.thread = threading.Thread(target=cls.server.serve_forever)
+        cls.thread.daemon = True
+        cls.thread.start()
+        cls.url = 'http://127.0.0.1:%d/validate' % cls.server.server_port
+        unpack_example(os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'))
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        delete_example('AlNi_static_LDA')
+
+    def setUp(self):
+        StubHandler.failures = 0
+        StubHandler.delay = 0
+        StubHandler.requests = []
+        self.client = QualityReportClient(self.url, timeout=5, backoff_factor=0)
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_report(self):
+        result = directory_to_pif('AlNi_static_LDA', report_client=self.client)
+        self.assertEqual({'score': 7, 'tests': []}, result.quality_report)
+        self.assertEqual([('/validate/json/tarfile', ['INCAR', 'OUTCAR'])], StubHandler.requests)
+
+        # Nothing is written to the working directory
+        self.assertFalse(os.path.exists('tmp.tar'))
+
+        # The text report gives the score on its first line
+        report, score = self.client.report(DirectorySource('AlNi_static_LDA'), inline=False)
+        self.assertEqual(7, score)
+        self.assertEqual('/validate/tarfile', StubHandler.requests[-1][0])
+
+    def test_retries(self):
+        StubHandler.failures = 2
+        result = directory_to_pif('AlNi_static_LDA', report_client=self.client)
+        self.assertEqual(7, result.quality_report['score'])
+        self.assertEqual(3, len(StubHandler.requests))
+
+        # Once out of retries, the pif has no report
+        StubHandler.failures = 10
+        StubHandler.requests = []
+        result = directory_to_pif('AlNi_static_LDA', report_client=QualityReportClient(self.url, retries=1,
+                                                                                       backoff_factor=0))
+        self.assertFalse(hasattr(result, 'quality_report'))
+        self.assertEqual(2, len(StubHandler.requests))
+
+    def test_timeout(self):
+        import requests
+        StubHandler.delay = 1
+        client = QualityReportClient(self.url, timeout=0.2, retries=0)
+        with self.assertRaises(requests.exceptions.RequestException):
+            directory_to_pif('AlNi_static_LDA', report_client=client)
+
+    def test_deferred(self):
+        paths = [os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'), 'AlNi_static_LDA',
+                 os.path.join('examples', 'pwscf', 'NaF.scf.tar.gz')]
+        results = list(directories_to_pifs(paths, max_workers=2, processes=False, report_workers=2,
+                                           report_client=self.client))
+        self.assertEqual(paths, [path for path, result in results])
+        self.assertEqual(7, results[0][1].quality_report['score'])
+        self.assertEqual(7, results[1][1].quality_report['score'])
+        self.assertFalse(hasattr(results[2][1], 'quality_report'))
+        self.assertEqual(2, len(StubHandler.requests))
+
+    def test_cache(self):
+        cache = ReportCache(tempfile.mkdtemp())
+        client = QualityReportClient(self.url, timeout=5, cache=cache)
+        self.assertEqual(7, directory_to_pif('AlNi_static_LDA', report_client=client).quality_report['score'])
+        self.assertEqual(1, len(StubHandler.requests))
+
+        # The same files are only scored once, wherever they are
+        self.assertEqual(7, directory_to_pif('AlNi_static_LDA', report_client=client).quality_report['score'])
+        archive = os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz')
+        result = list(directories_to_pifs([archive], processes=False, report_workers=1, report_client=client))[0][1]
+        self.assertEqual(7, result.quality_report['score'])
+        self.assertEqual(1, len(StubHandler.requests))
+
+        # Reports expire
+        cache.ttl = 0
+        time.sleep(0.01)
+        directory_to_pif('AlNi_static_LDA', report_client=client)
+        self.assertEqual(2, len(StubHandler.requests))
+
+        # Failures are not cached
+        cache.ttl = None
+        cache.clear()
+        StubHandler.failures = 10
+        client = QualityReportClient(self.url, retries=0, cache=cache)
+        self.assertFalse(hasattr(directory_to_pif('AlNi_static_LDA', report_client=client), 'quality_report'))
+        self.assertEqual(0, len(cache._entries()))
+        shutil.rmtree(cache.directory)
+
+if __name__ == '__main__':
+    unittest.main()
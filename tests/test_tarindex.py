@@ -0,0 +1,86 @@
+import unittest
+from unittest import mock
+from dfttopif import tarfile_to_pif
+from dfttopif import tarindex, drivers
+from dfttopif.tarindex import get_index, load_index, index_path, IndexedTarSource
+from dfttopif.parsers.base import TarSource
+from pypif import pif
+import tarfile
+import tempfile
+import shutil
+import os
+
+
+class TestTarIndex(unittest.TestCase):
+    '''
+    Tests for the seek index of tar.gz archives
+    '''
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.archive = os.path.join(self.dir, 'AlNi_static_LDA.tar.gz')
+        shutil.copy(os.path.join('examples', 'vasp', 'AlNi_static_LDA.tar.gz'), self.archive)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_index(self):
+        self.assertIsNone(load_index(self.archive))
+        index = get_index(self.archive)
+        self.assertTrue(os.path.isfile(index_path(self.archive)))
+        self.assertEqual(index, load_index(self.archive))
+
+        # The members are the same as when reading the archive
+        source = IndexedTarSource(self.archive)
+        with tarfile.open(self.archive) as tar:
+            expected = TarSource(tar, TarSource.find_root(tar))
+            self.assertEqual(expected.root, source.root)
+            self.assertEqual(sorted(expected.list_files()), sorted(source.list_files()))
+            for f in expected.list_files():
+                with expected.open_raw(f) as a, source.open_raw(f) as b:
+                    self.assertEqual(a.read(), b.read())
+
+        # The index is rebuilt when the archive changes
+        os.utime(self.archive, (0, 0))
+        self.assertIsNone(load_index(self.archive))
+
+    def test_conversion(self):
+        expected = pif.dumps(tarfile_to_pif(self.archive, quality_report=False))
+        self.assertEqual(expected, pif.dumps(tarfile_to_pif(self.archive, seek_index=True, quality_report=False)))
+        self.assertTrue(os.path.isfile(index_path(self.archive)))
+        self.assertEqual(expected, pif.dumps(tarfile_to_pif(self.archive, seek_index=True, quality_report=False)))
+
+    @unittest.skipIf(tarindex.indexed_gzip is None, 'indexed_gzip is not installed')
+    def test_open_once(self):
+        # The archive is opened, and its restart points loaded, once per conversion
+        get_index(self.archive)
+        expected = pif.dumps(tarfile_to_pif(self.archive, quality_report=False))
+        opened = []
+        IndexedGzipFile = tarindex.indexed_gzip.IndexedGzipFile
+        with mock.patch.object(tarindex.indexed_gzip, 'IndexedGzipFile',
+                               side_effect=lambda *args: opened.append(args) or IndexedGzipFile(*args)):
+            self.assertEqual(expected, pif.dumps(tarfile_to_pif(self.archive, seek_index=True, quality_report=False)))
+        self.assertEqual([(self.archive,)], opened)
+
+    def test_without_indexed_gzip(self):
+        # The archive is read in a single pass instead, rather than decompressed again for each member
+        expected = pif.dumps(tarfile_to_pif(self.archive, quality_report=False))
+        with mock.patch.object(drivers, 'indexed_gzip', None):
+            with self.assertWarns(UserWarning):
+                result = tarfile_to_pif(self.archive, seek_index=True, quality_report=False)
+        self.assertEqual(expected, pif.dumps(result))
+        self.assertFalse(os.path.isfile(index_path(self.archive)))
+
+    @unittest.skipIf(tarindex.indexed_gzip is None, 'indexed_gzip is not installed')
+    def test_unwritable(self):
+        # The restart points of the gzip stream cannot be saved, e.g. in a read-only directory
+        expected = pif.dumps(tarfile_to_pif(self.archive, quality_report=False))
+        missing = os.path.join(self.dir, 'missing', 'AlNi_static_LDA.tar.gz.gzidx')
+        with mock.patch.object(tarindex, '_gzip_index_path', return_value=missing):
+            index = get_index(self.archive)
+            self.assertFalse(index['gzip_index'])
+            self.assertEqual(['AlNi_static_LDA.tar.gz', 'AlNi_static_LDA.tar.gz.index'], sorted(os.listdir(self.dir)))
+            self.assertEqual(expected, pif.dumps(tarfile_to_pif(self.archive, seek_index=True, quality_report=False)))
+
+if __name__ == '__main__':
+    unittest.main()